@@ -1,14 +1,33 @@
 import asyncio
+import signal
+import sys
+
+import uvloop
+from dotenv import load_dotenv
 
 
 async def launch():
+    # Settings classes read .env themselves; this exposes it to the SDKs too
+    load_dotenv()
+
     from src.athena.core.deus.athena.athena_instance import Athena
 
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, stop_event.set)
+    loop.add_signal_handler(signal.SIGINT, stop_event.set)
+
     athena = Athena()
     await athena.start()
-    # For testing purposes:
-    await asyncio.sleep(3600)
+    # Run until the process is asked to shut down
+    await stop_event.wait()
+    await athena.stop()
 
 
 if __name__ == "__main__":
-    asyncio.run(launch())
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(launch())
+    else:
+        uvloop.install()
+        asyncio.run(launch())
@@ -1,12 +1,5 @@
-import uvloop
-
-from .deus.athena.athena_instance import Athena
-from .deus.base.base_instance import Deus, DeusAbstract
 from .system import diskcache, logger, system_config
 
-uvloop.install()
-
-
 __all__ = [
     "logger",
     "system_config",
@@ -15,3 +8,21 @@ __all__ = [
     "Athena",
     "Deus",
 ]
+
+
+def __getattr__(name: str):
+    # Deus instances pull in the AI providers and Telegram clients,
+    # so they are only imported when first accessed
+    if name == "Athena":
+        from .deus.athena.athena_instance import Athena
+
+        return Athena
+    if name == "Deus":
+        from .deus.base.base_instance import Deus
+
+        return Deus
+    if name == "DeusAbstract":
+        from .deus.base.base_abstract import DeusAbstract
+
+        return DeusAbstract
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,28 +1,45 @@
+import importlib
+import os
+from collections.abc import Iterator
+from functools import cache
 from typing import Optional
 
+from dotenv import dotenv_values
 from pydantic_ai import Agent
 
-from .claude.claude_client import ClaudeLLM
-from .deepseek.deepseek_client import DeepSeekLLM
-from .gemini.gemini_client import GeminiLLM
-from .groq.groq_client import GroqLLM
-from .mistral.mistral_client import MistralLLM
-from .ollama.ollama_client import OllamaLLM
-from .openai.openai_client import OpenAILLM
-from .openrouter.openrouter_client import OpenRouterLLM
-from .shared import LLMBase, MissingCredentialsError
-from .xai.xai_client import xAILLM
+from .shared import (
+    LLMBase,
+    LLMConfig,
+    MissingCredentialsError,
+    NoProviderAvailableError,
+    ProviderUnavailableError,
+)
 
+# Provider clients are imported on demand so only the selected SDK is loaded
 _SERVICE_REGISTRY = {
-    "gemini": GeminiLLM,
-    "claude": ClaudeLLM,
-    "deepseek": DeepSeekLLM,
-    "groq": GroqLLM,
-    "mistral": MistralLLM,
-    "ollama": OllamaLLM,
-    "openai": OpenAILLM,
-    "openrouter": OpenRouterLLM,
-    "xai": xAILLM,
+    "gemini": (".gemini.gemini_client", "GeminiLLM"),
+    "claude": (".claude.claude_client", "ClaudeLLM"),
+    "deepseek": (".deepseek.deepseek_client", "DeepSeekLLM"),
+    "groq": (".groq.groq_client", "GroqLLM"),
+    "mistral": (".mistral.mistral_client", "MistralLLM"),
+    "ollama": (".ollama.ollama_client", "OllamaLLM"),
+    "openai": (".openai.openai_client", "OpenAILLM"),
+    "openrouter": (".openrouter.openrouter_client", "OpenRouterLLM"),
+    "xai": (".xai.xai_client", "xAILLM"),
+}
+
+# Environment prefixes of each provider's LLMConfig, used to skip providers
+# that are clearly not configured before importing and building them
+_ENV_PREFIXES = {
+    "gemini": "GEMINI_",
+    "claude": "CLAUDE_",
+    "deepseek": "DEEPSEEK_",
+    "groq": "GROQ_",
+    "mistral": "MISTRAL_",
+    "ollama": "OLLAMA_",
+    "openai": "OPENAI_",
+    "openrouter": "OPENROUTER_",
+    "xai": "XAI_",
 }
 
 
@@ -41,6 +58,48 @@ def get_agent(service_name: str | None = None) -> Agent:
     return resposne.agent
 
 
+def _load_service_class(name: str) -> type[LLMBase]:
+    """Import the client class registered under name"""
+    module_name, class_name = _SERVICE_REGISTRY[name]
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, class_name)
+
+
+@cache
+def _get_service_instance(name: str) -> LLMBase:
+    """
+    Build the service once per provider name.
+
+    Failed constructions raise and are therefore not cached, so a provider
+    with missing credentials is retried on the next call.
+    """
+    return _load_service_class(name)()
+
+
+def _read_settings_env() -> dict[str, str]:
+    """
+    Variables visible to the providers' LLMConfig: the env_file merged under
+    the process environment, keyed case-insensitively as pydantic-settings
+    matches them
+    """
+    env = {}
+    env_file = LLMConfig.model_config.get("env_file")
+    if env_file:
+        env.update(
+            (key.lower(), value)
+            for key, value in dotenv_values(env_file).items()
+            if value is not None
+        )
+    env.update((key.lower(), value) for key, value in os.environ.items())
+    return env
+
+
+def _has_credentials_in_env(name: str, env: dict[str, str]) -> bool:
+    """Check that the provider's API key and model name are set in env"""
+    prefix = _ENV_PREFIXES[name].lower()
+    return bool(env.get(f"{prefix}api_key") and env.get(f"{prefix}model_name"))
+
+
 def _get_specific_service(name: str) -> LLMBase:
     """Get service by explicit name"""
     name = name.lower()
@@ -49,22 +108,54 @@ def _get_specific_service(name: str) -> LLMBase:
         raise ValueError(f"Unknown service '{name}'. Available: {available}")
 
     try:
-        return _SERVICE_REGISTRY[name]()
+        return _get_service_instance(name)
     except MissingCredentialsError:
         raise ValueError(f"Missing credentials for {name}")
 
 
-def _find_first_available() -> LLMBase:
-    """Find first service with valid credentials"""
-    errors = []
-
-    for name, service_class in _SERVICE_REGISTRY.items():
+def _iter_available(errors: list[str]) -> Iterator[LLMBase]:
+    """
+    Yield every configured provider whose circuit is closed, in registry
+    order, recording why each skipped provider was passed over in errors
+    """
+    env = _read_settings_env()
+    for name in _SERVICE_REGISTRY:
+        if not _has_credentials_in_env(name, env):
+            errors.append(f"{name}: Missing credentials for {name}")
+            continue
         try:
-            return service_class()
+            service = _get_service_instance(name)
         except MissingCredentialsError as e:
             errors.append(f"{name}: {e}")
+            continue
         except Exception as e:
             errors.append(f"{name}: {str(e)}")
+            continue
+
+        # Fall through to the next provider while this one's circuit is open
+        if service.is_available:
+            yield service
+        else:
+            errors.append(f"{name}: {ProviderUnavailableError(service.provider_name)}")
+
+
+def _find_first_available() -> LLMBase:
+    """Find first service with valid credentials"""
+    errors = []
+    for service in _iter_available(errors):
+        return service
+    raise NoProviderAvailableError(errors)
 
-    error_list = "\n- ".join(errors)
-    raise RuntimeError(f"No available AI providers:\n- {error_list}")
+
+async def run_first_available(*args, **kwargs):
+    """
+    Run the first available provider's agent, moving on to the next provider
+    when one's circuit opens before the call goes out
+    """
+    errors = []
+    for service in _iter_available(errors):
+        try:
+            return await service.run(*args, **kwargs)
+        except ProviderUnavailableError as e:
+            errors.append(f"{service.provider_name}: {e}")
+    raise NoProviderAvailableError(errors)
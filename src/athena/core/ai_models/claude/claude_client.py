@@ -1,4 +1,4 @@
-from typing import List
+from functools import cached_property
 from ..shared import LLMBase
 from .claude_config import ClaudeConfig
 from pydantic_ai import Agent
@@ -10,19 +10,15 @@ class ClaudeLLM(LLMBase):
     def provider_name(self) -> str:
         return "Claude"
 
-    @property
+    @cached_property
     def agent(self) -> Agent:
-        return self._agent
+        return Agent(model=self.model, name=self.provider_name)
 
     def __init__(self):
-        config = ClaudeConfig()
+        config = ClaudeConfig.instance()
         super().__init__(config)
 
         self.model = AnthropicModel(
             model_name=config.model_name,
             api_key=config.api_key,
         )
-        self._agent = Agent(model=self.model, name=self.provider_name)
-
-    def embed_content(self, content: str) -> List[float]:
-        pass
@@ -1,5 +1,5 @@
-from typing import List
-from ..shared import LLMBase
+from functools import cached_property
+from ..shared import LLMBase, get_shared_async_client
 from .deepseek_config import DeepSeekConfig
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
@@ -10,20 +10,17 @@ class DeepSeekLLM(LLMBase):
     def provider_name(self) -> str:
         return "DeepSeek"
 
-    @property
+    @cached_property
     def agent(self) -> Agent:
-        return self._agent
+        return Agent(model=self.model, name=self.provider_name)
 
     def __init__(self):
-        config = DeepSeekConfig()
+        config = DeepSeekConfig.instance()
         super().__init__(config)
 
         self.model = OpenAIModel(
             model_name=config.model_name,
             api_key=config.api_key,
+            http_client=get_shared_async_client(),
             base_url=config.base_url,
         )
-        self._agent = Agent(model=self.model, name=self.provider_name)
-
-    def embed_content(self, content: str) -> List[float]:
-        pass
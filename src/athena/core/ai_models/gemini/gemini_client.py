@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import List
 
 import google.generativeai as genai
@@ -15,12 +16,12 @@ class GeminiLLM(LLMBase):
     def provider_name(self) -> str:
         return "Gemini"
 
-    @property
+    @cached_property
     def agent(self) -> Agent:
-        return self._agent
+        return Agent(model=self.model, name=self.provider_name)
 
     def __init__(self):
-        config = GeminiConfig()
+        config = GeminiConfig.instance()
         super().__init__(config)
         print(config)
 
@@ -28,12 +29,11 @@ class GeminiLLM(LLMBase):
             model_name=config.model_name,
             api_key=config.api_key,
         )
-        self._agent = Agent(model=self.model, name=self.provider_name)
         self.embedding_model = f"{config.model_prefix}{config.embedding_model_name}"
 
         genai.configure(api_key=config.api_key)
 
-    def embed_content(
+    def _embed_content(
         self, content: str, task_type: EmbeddingTaskType | str = None
     ) -> List[float]:
         if task_type is not None and isinstance(task_type, str):
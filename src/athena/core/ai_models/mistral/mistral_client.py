@@ -1,4 +1,4 @@
-from typing import List
+from functools import cached_property
 from ..shared import LLMBase
 from .mistral_config import MistralConfig
 from pydantic_ai import Agent
@@ -10,19 +10,15 @@ class MistralLLM(LLMBase):
     def provider_name(self) -> str:
         return "Mistral"
 
-    @property
+    @cached_property
     def agent(self) -> Agent:
-        return self._agent
+        return Agent(model=self.model, name=self.provider_name)
 
     def __init__(self):
-        config = MistralConfig()
+        config = MistralConfig.instance()
         super().__init__(config)
 
         self.model = MistralModel(
             model_name=config.model_name,
             api_key=config.api_key,
         )
-        self._agent = Agent(model=self.model, name=self.provider_name)
-
-    def embed_content(self, content: str) -> List[float]:
-        pass
@@ -1,5 +1,5 @@
-from typing import List
-from ..shared import LLMBase
+from functools import cached_property
+from ..shared import LLMBase, get_shared_async_client
 from .openai_config import OpenAIConfig
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
@@ -10,19 +10,16 @@ class OpenAILLM(LLMBase):
     def provider_name(self) -> str:
         return "OpenAI"
 
-    @property
+    @cached_property
     def agent(self) -> Agent:
-        return self._agent
+        return Agent(model=self.model, name=self.provider_name)
 
     def __init__(self):
-        config = OpenAIConfig()
+        config = OpenAIConfig.instance()
         super().__init__(config)
 
         self.model = OpenAIModel(
             model_name=config.model_name,
             api_key=config.api_key,
+            http_client=get_shared_async_client(),
         )
-        self._agent = Agent(model=self.model, name=self.provider_name)
-
-    def embed_content(self, content: str) -> List[float]:
-        pass
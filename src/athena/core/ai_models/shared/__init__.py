@@ -1,4 +1,17 @@
+from .http_client import get_shared_async_client
 from .llm_base import LLMBase
-from .schemas import LLMConfig, MissingCredentialsError
+from .schemas import (
+    LLMConfig,
+    MissingCredentialsError,
+    NoProviderAvailableError,
+    ProviderUnavailableError,
+)
 
-__all__ = ["LLMBase", "LLMConfig", "MissingCredentialsError"]
+__all__ = [
+    "LLMBase",
+    "LLMConfig",
+    "MissingCredentialsError",
+    "NoProviderAvailableError",
+    "ProviderUnavailableError",
+    "get_shared_async_client",
+]
@@ -0,0 +1,18 @@
+"""
+Shared HTTP Client
+
+One connection pool reused by every provider that talks over httpx
+"""
+
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache(maxsize=1)
+def get_shared_async_client() -> httpx.AsyncClient:
+    """Return the process-wide async HTTP client"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
@@ -4,11 +4,30 @@ Core LLM Interface Definitions
 Defines abstract base classes for all AI service implementations
 """
 
+import asyncio
+import random
 from abc import ABC, abstractmethod
 
+import httpx
+from circuitbreaker import CircuitBreaker
 from pydantic_ai import Agent
 
-from .schemas import LLMConfig, MissingCredentialsError
+from src.athena.core.system import system_config
+
+from .retry_governor import retry_governor
+from .schemas import LLMConfig, MissingCredentialsError, ProviderUnavailableError
+
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Whether the error is a transient transport failure or a retryable status"""
+    if isinstance(error, (httpx.TransportError, TimeoutError)):
+        return True
+    # Vendor SDKs wrap httpx transport errors in their own exception types
+    if isinstance(error.__cause__, httpx.TransportError):
+        return True
+    return getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES
 
 
 class LLMBase(ABC):
@@ -17,6 +36,13 @@ class LLMBase(ABC):
     def __init__(self, config: LLMConfig):
         self.config = config
         self._validate_credentials()
+        self._breaker = CircuitBreaker(
+            failure_threshold=system_config.FAILURE_THRESHOLD,
+            recovery_timeout=system_config.RECOVERY_TIMEOUT,
+            # Only outages count: bad prompts and validation errors don't
+            expected_exception=lambda _, error: is_retryable_error(error),
+            name=self.provider_name,
+        )
 
     def _validate_credentials(self):
         """Validate credentials using Pydantic validation"""
@@ -25,6 +51,47 @@ class LLMBase(ABC):
         if not self.config.model_name:
             raise MissingCredentialsError(self.provider_name)
 
+    @property
+    def is_available(self) -> bool:
+        """Whether the provider's circuit breaker lets calls through"""
+        return not self._breaker.opened
+
+    async def run(self, *args, **kwargs):
+        """Run the agent, failing fast while the provider's circuit is open"""
+        if self._breaker.opened:
+            raise ProviderUnavailableError(self.provider_name)
+        return await self._breaker.call_async(
+            self._with_retry, lambda: self.agent.run(*args, **kwargs)
+        )
+
+    async def _with_retry(self, coro_factory):
+        """
+        Await coro_factory(), retrying transient failures up to
+        default_max_retries times with full-jitter exponential backoff.
+        Retries are skipped while the retry governor has them disabled.
+        """
+        attempt = 0
+        while True:
+            try:
+                result = await coro_factory()
+            except Exception as e:
+                if not is_retryable_error(e):
+                    raise
+                retry_governor.record(self.provider_name, success=False)
+                if attempt >= self.config.default_max_retries:
+                    raise
+                if not retry_governor.retries_allowed(self.provider_name):
+                    raise
+                delay = min(
+                    system_config.RETRY_MAX_DELAY,
+                    system_config.RETRY_BASE_DELAY * 2**attempt,
+                )
+                attempt += 1
+                await asyncio.sleep(random.uniform(0, delay))
+            else:
+                retry_governor.record(self.provider_name, success=True)
+                return result
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -37,7 +104,12 @@ class LLMBase(ABC):
         """Return the agent for the LLM"""
         pass
 
-    @abstractmethod
-    def embed_content(self, content: str) -> list[float]:
-        """Embed content using the LLM"""
-        pass
+    def embed_content(self, content, *args, **kwargs):
+        """Embed content, failing fast while the provider's circuit is open"""
+        if self._breaker.opened:
+            raise ProviderUnavailableError(self.provider_name)
+        return self._breaker.call(self._embed_content, content, *args, **kwargs)
+
+    def _embed_content(self, content: str) -> list[float]:
+        """Embed content using the LLM; providers with embeddings override this"""
+        raise NotImplementedError(f"{self.provider_name} does not support embeddings")
@@ -0,0 +1,103 @@
+"""
+Retry Governor
+
+Tracks per-provider rejection rates and switches retries off while a
+provider is rejecting most requests, so retries don't amplify an outage
+"""
+
+import time
+from dataclasses import dataclass
+
+from src.athena.core.system import system_config
+
+
+@dataclass
+class ProviderRetryStats:
+    bucket_start: float = 0.0
+    successes: int = 0
+    rejections: int = 0
+    previous_successes: int = 0
+    previous_rejections: int = 0
+    disabled_until: float | None = None
+    probing: bool = False
+
+
+class RetryGovernor:
+    """
+    Sliding-window controller deciding whether a provider may be retried.
+
+    Outcomes are counted in two rotating buckets of `window` seconds. When
+    the rejection rate over both buckets exceeds `threshold`, retries are
+    disabled for `cooldown` seconds. After the cool-down a single probe is
+    let through: success re-enables retries, failure restarts the cool-down.
+    """
+
+    def __init__(
+        self,
+        window: float = system_config.RETRY_WINDOW,
+        threshold: float = system_config.RETRY_REJECTION_THRESHOLD,
+        cooldown: float = system_config.RETRY_COOLDOWN,
+        min_samples: int = system_config.RETRY_MIN_SAMPLES,
+    ):
+        self.window = window
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.min_samples = min_samples
+        self._stats: dict[str, ProviderRetryStats] = {}
+
+    def _get_stats(self, provider: str, now: float) -> ProviderRetryStats:
+        stats = self._stats.get(provider)
+        if stats is None:
+            stats = self._stats[provider] = ProviderRetryStats(bucket_start=now)
+
+        elapsed = now - stats.bucket_start
+        if elapsed >= self.window:
+            # Keep the last bucket only if it is still adjacent to the window
+            if elapsed < 2 * self.window:
+                stats.previous_successes = stats.successes
+                stats.previous_rejections = stats.rejections
+            else:
+                stats.previous_successes = stats.previous_rejections = 0
+            stats.successes = stats.rejections = 0
+            stats.bucket_start = now
+        return stats
+
+    def retries_allowed(self, provider: str) -> bool:
+        """Whether a failed call to the provider may be retried right now"""
+        now = time.monotonic()
+        stats = self._get_stats(provider, now)
+
+        if stats.disabled_until is not None:
+            if now < stats.disabled_until or stats.probing:
+                return False
+            stats.probing = True
+            return True
+
+        rejections = stats.rejections + stats.previous_rejections
+        total = rejections + stats.successes + stats.previous_successes
+        if total >= self.min_samples and rejections / total > self.threshold:
+            stats.disabled_until = now + self.cooldown
+            return False
+        return True
+
+    def record(self, provider: str, success: bool):
+        """Record the outcome of a call to the provider"""
+        now = time.monotonic()
+        stats = self._get_stats(provider, now)
+
+        if stats.probing:
+            stats.probing = False
+            if success:
+                stats.disabled_until = None
+                stats.successes = stats.rejections = 0
+                stats.previous_successes = stats.previous_rejections = 0
+            else:
+                stats.disabled_until = now + self.cooldown
+
+        if success:
+            stats.successes += 1
+        else:
+            stats.rejections += 1
+
+
+retry_governor = RetryGovernor()
@@ -4,12 +4,11 @@ Core AI Response Schemas
 Shared data models for all AI service implementations
 """
 
+from functools import cache
+
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 from pydantic import model_validator
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 class MissingCredentialsError(Exception):
@@ -20,6 +19,22 @@ class MissingCredentialsError(Exception):
         self.provider = provider
 
 
+class ProviderUnavailableError(Exception):
+    """Raised when a provider's circuit breaker is open"""
+
+    def __init__(self, provider: str):
+        super().__init__(f"Provider {provider} is temporarily unavailable")
+        self.provider = provider
+
+
+class NoProviderAvailableError(RuntimeError):
+    """Raised when no AI provider can serve a request"""
+
+    def __init__(self, errors: list[str]):
+        super().__init__(f"No available AI providers: {len(errors)} failed")
+        self.errors = errors
+
+
 class LLMConfig(BaseSettings):
     """Base class for LLM configuration"""
 
@@ -36,6 +51,12 @@ class LLMConfig(BaseSettings):
         extra = "ignore"
         env_file = ".env"
 
+    @classmethod
+    @cache
+    def instance(cls):
+        """Return the settings for this provider, read from the environment once"""
+        return cls()
+
     @model_validator(mode="before")
     def validate_base_fields(cls, values):
         if not values.get("model_name"):
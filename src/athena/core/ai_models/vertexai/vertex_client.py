@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import cached_property
 
 import vertexai
 from pydantic_ai import Agent
@@ -25,12 +26,12 @@ class VertexLLM(LLMBase):
     def provider_name(self) -> str:
         return "Vertex"
 
-    @property
+    @cached_property
     def agent(self) -> Agent:
-        return self._agent
+        return Agent(model=self.model, name=self.provider_name)
 
     def __init__(self):
-        config = VertexConfig()
+        config = VertexConfig.instance()
         super().__init__(config)
 
         self.model = VertexAIModel(
@@ -39,14 +40,13 @@ class VertexLLM(LLMBase):
             region=config.region,
         )
 
-        self._agent = Agent(model=self.model, name=self.provider_name)
         self.embedding_model = TextEmbeddingModel.from_pretrained(
             config.embedding_model_name
         )
 
         vertexai.init(project=config.project_id)
 
-    def embed_content(
+    def _embed_content(
         self,
         content: list[str],
         task_type: EmbeddingTaskType | str = EmbeddingTaskType.CLUSTERING,
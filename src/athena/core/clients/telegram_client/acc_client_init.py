@@ -46,7 +46,7 @@ class TelegramAccountClient(ClientBase):
 
     def get_first_name_short(self) -> str:
         username = self.get_username()
-        return username.split(" ")[0] if username else None
+        return username.partition(" ")[0] if username else None
 
     def get_telegram_id(self) -> str:
         return self.client_data.user_id
@@ -54,13 +54,10 @@ class TelegramAccountClient(ClientBase):
     async def start(self):
         """Start clients with proper initialization order"""
         try:
-            # Start user client first to establish session
             logger.info("User client initilization")
             await self.client.start()
             self._store_data(await self.client.get_me())
             logger.info(f"User client initialized for {self.client_data.username}")
-            # Allow event loop to process
-            await asyncio.sleep(0.5)
 
         except Exception as e:
             logger.error(f"Client startup failed: {str(e)}")
@@ -70,15 +67,24 @@ class TelegramAccountClient(ClientBase):
     async def stop(self):
         """Stop the client and clean up dispatchers"""
         logger.info("Stopping Telegram client")
-        stop_tasks = []
 
         # Stop dispatcher first
         logger.info("Stopping user client dispatcher")
         self.client.dispatcher.updater_running = False
-        for task in self.client.dispatcher.handler_worker_tasks:
+        worker_tasks = list(self.client.dispatcher.handler_worker_tasks)
+        for task in worker_tasks:
             task.cancel()
-        stop_tasks.append(self.client.stop())
-        await asyncio.gather(*stop_tasks, return_exceptions=True)
+
+        # Wait for the cancelled workers and the client together, bounded
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *worker_tasks, self.client.stop(), return_exceptions=True
+                ),
+                timeout=load_config().STOP_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.error("Timed out stopping user client")
 
         # Clean up references
         logger.info("Cleaning up client references")
@@ -8,6 +8,7 @@ from src.athena.core import logger
 from src.athena.core.clients.client_base import ClientBase
 from src.athena.core.clients.telegram_client.telegram_config import (
     BotClientData,
+    ChatActionState,
     load_common_args,
     load_config,
 )
@@ -27,6 +28,12 @@ class TelegramBotClient(ClientBase):
 
         self.data = BotClientData()
         self.deus_instance = deus
+
+        # Chat actions of every active action_scheduler, sent by one task
+        self._chat_actions: dict[tuple[int, enums.ChatAction], ChatActionState] = {}
+        self._chat_action_wakeup = asyncio.Event()
+        self._chat_action_task: asyncio.Task | None = None
+
         if not config.BOT_TOKEN:
             logger.error("BOT_TOKEN is not set in the config")
             raise ValueError("BOT_TOKEN is not set in the config")
@@ -71,15 +78,24 @@ class TelegramBotClient(ClientBase):
     async def stop(self):
         """Stop the client and clean up dispatchers"""
         logger.info("Stopping Telegram bot client")
-        stop_tasks = []
 
         # Stop dispatcher first
         logger.info("Stopping bot client dispatcher")
         self.client.dispatcher.updater_running = False
-        for task in self.client.dispatcher.handler_worker_tasks:
+        worker_tasks = list(self.client.dispatcher.handler_worker_tasks)
+        for task in worker_tasks:
             task.cancel()
-        stop_tasks.append(self.client.stop())
-        await asyncio.gather(*stop_tasks, return_exceptions=True)
+
+        # Wait for the cancelled workers and the client together, bounded
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *worker_tasks, self.client.stop(), return_exceptions=True
+                ),
+                timeout=load_config().STOP_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.error("Timed out stopping bot client")
 
     def _store_data(self, bot: User):
         self.data.bot_id = bot.id
@@ -90,16 +106,55 @@ class TelegramBotClient(ClientBase):
         self, chat_id: int, action: enums.ChatAction, delay: int = 5
     ):
         """Keep sending chat action until context exits"""
-        stop_event = asyncio.Event()
+        key = (chat_id, action)
+        state = self._chat_actions.get(key)
+        if state is None:
+            state = self._chat_actions[key] = ChatActionState(delay=delay)
+            self._chat_action_wakeup.set()
+        else:
+            state.refs += 1
 
-        async def action_loop():
-            while not stop_event.is_set():
-                await self.client.send_chat_action(chat_id, action)
-                await asyncio.sleep(delay)
+        if self._chat_action_task is None or self._chat_action_task.done():
+            self._chat_action_task = asyncio.create_task(self._chat_action_loop())
 
-        task = asyncio.create_task(action_loop())
         try:
             yield
         finally:
-            stop_event.set()
-            await task
+            state.refs -= 1
+            if state.refs == 0:
+                del self._chat_actions[key]
+
+    async def _chat_action_loop(self):
+        """Send every due chat action, then sleep until the next one is due"""
+        loop = asyncio.get_running_loop()
+        while self._chat_actions:
+            self._chat_action_wakeup.clear()
+
+            now = loop.time()
+            due = []
+            for key, state in self._chat_actions.items():
+                if state.next_send <= now:
+                    state.next_send = now + state.delay
+                    due.append(key)
+
+            results = await asyncio.gather(
+                *(
+                    self.client.send_chat_action(chat_id, action)
+                    for chat_id, action in due
+                ),
+                return_exceptions=True,
+            )
+            for (chat_id, _), result in zip(due, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to send chat action to {chat_id}: {result}")
+
+            if not self._chat_actions:
+                break
+            timeout = min(s.next_send for s in self._chat_actions.values())
+            try:
+                await asyncio.wait_for(
+                    self._chat_action_wakeup.wait(),
+                    timeout=max(timeout - loop.time(), 0),
+                )
+            except asyncio.TimeoutError:
+                pass
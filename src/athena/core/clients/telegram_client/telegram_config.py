@@ -1,11 +1,13 @@
 from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
 from typing import Optional
 from pathlib import Path
 from pydantic_settings import BaseSettings
 from pydantic import model_validator
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientData:
     user_id: Optional[int] = None
     is_premium: Optional[bool] = None
@@ -13,12 +15,19 @@ class ClientData:
     first_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BotClientData:
     bot_id: Optional[int] = None
     bot_username: Optional[str] = None
 
 
+@dataclass(slots=True)
+class ChatActionState:
+    delay: float
+    refs: int = 1
+    next_send: float = 0.0
+
+
 class TelegramConfig(BaseSettings):
     # Required fields
     API_ID: int
@@ -33,6 +42,7 @@ class TelegramConfig(BaseSettings):
     SESSION_DIR: Path = Path(__file__).parent.parent / "sessions"
     IN_MEMORY_SESSION: bool = False
     HIDE_PASSWORD: bool = True
+    STOP_TIMEOUT: float = 5.0
 
     APP_VERSION: str = "0.0.1"
     DEVICE_MODEL: str = "Athena"
@@ -50,19 +60,24 @@ class TelegramConfig(BaseSettings):
         extra = "ignore"
 
 
+@cache
 def load_config() -> TelegramConfig:
     return TelegramConfig()
 
 
-def load_common_args():
+@cache
+def load_common_args() -> MappingProxyType:
+    # Read-only view, since every caller shares the cached mapping
     config = load_config()
-    return {
-        "api_id": config.API_ID,
-        "api_hash": config.API_HASH,
-        "in_memory": config.IN_MEMORY_SESSION,
-        "app_version": config.APP_VERSION,
-        "device_model": config.DEVICE_MODEL,
-        "system_version": config.SYSTEM_VERSION,
-        "workdir": str(config.SESSION_DIR),
-        "hide_password": config.HIDE_PASSWORD,
-    }
+    return MappingProxyType(
+        {
+            "api_id": config.API_ID,
+            "api_hash": config.API_HASH,
+            "in_memory": config.IN_MEMORY_SESSION,
+            "app_version": config.APP_VERSION,
+            "device_model": config.DEVICE_MODEL,
+            "system_version": config.SYSTEM_VERSION,
+            "workdir": str(config.SESSION_DIR),
+            "hide_password": config.HIDE_PASSWORD,
+        }
+    )
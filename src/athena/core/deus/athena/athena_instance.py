@@ -1,21 +1,25 @@
-from typing import Any, Coroutine
+from abc import ABCMeta
+
 from .athena_persona import ATHENA_ESSENCE
 from ..base.base_instance import DeusMaker
 
 ATHENA_PERSONA, ATHENA_POWERS, ATHENA_SETTINGS = ATHENA_ESSENCE.get_essence()
 
 
-class Athena(DeusMaker):
-    _instance = None
+class _Singleton(ABCMeta):
+    """
+    Metaclass returning the cached instance without re-entering __init__
+    """
 
-    def __new__(cls):
+    def __call__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.__initialized = False
+            cls._instance = super().__call__(*args, **kwargs)
         return cls._instance
 
+
+class Athena(DeusMaker, metaclass=_Singleton):
+    __slots__ = ()
+    _instance = None
+
     def __init__(self):
-        if self.__initialized:
-            return
         super().__init__(ATHENA_PERSONA, ATHENA_POWERS, ATHENA_SETTINGS)
-        self.__initialized = True
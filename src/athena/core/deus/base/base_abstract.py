@@ -6,6 +6,8 @@ class DeusAbstract(ABC):
     Abstract base class for all Deus instances
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def start(self):
         """
@@ -13,6 +15,13 @@ class DeusAbstract(ABC):
         """
         pass
 
+    @abstractmethod
+    async def stop(self):
+        """
+        Stop the Deus instance
+        """
+        pass
+
     @abstractmethod
     async def format_template(self, string_to_format: str) -> str:
         """
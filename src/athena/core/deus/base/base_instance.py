@@ -1,62 +1,158 @@
 import asyncio
-from typing import Union
+from functools import cache
+from typing import TYPE_CHECKING, Union
 
 from pydantic_ai import Agent
 
 from src.athena.core import logger
-from src.athena.core.clients import TelegramAccountClient, TelegramBotClient
-from src.athena.features.telegram.ai_services.agents import ApolloSummarizeAgent
 
 from ...ai_models import LLMBase
-from ...organon import OrganonModel
-from ..schemas import Persona, Powers, Settings, SupportedClients
+from ..schemas import (
+    Persona,
+    Powers,
+    Settings,
+    SupportedClients,
+    SupportedModels,
+    resolve_model,
+)
 from .base_abstract import DeusAbstract
 from .base_persona import BASE_ESSENCE
 
+if TYPE_CHECKING:
+    from src.athena.core.clients import TelegramAccountClient, TelegramBotClient
+    from src.athena.features.telegram.ai_services.agents import (
+        ApolloSummarizeAgent,
+    )
+
+    from ...organon import OrganonModel
+
+
 BASE_PERSONA = BASE_ESSENCE.persona
 BASE_POWERS = BASE_ESSENCE.powers
 BASE_SETTINGS = BASE_ESSENCE.settings
 
+# Deus attribute holding each supported client
+_CLIENT_ATTRS = {
+    SupportedClients.TELEGRAM_USER: "telegram_user",
+    SupportedClients.TELEGRAM_BOT: "telegram_bot",
+}
+
+
+@cache
+def _get_model(model: SupportedModels) -> LLMBase:
+    """Model client shared by every Deus selecting the same model"""
+    return resolve_model(model)()
+
 
 class Deus(DeusAbstract):
     """
     Abstract base class for all Deus implementations
     """
 
+    __slots__ = (
+        "persona",
+        "powers",
+        "settings",
+        "clients",
+        "model",
+        "agent",
+        "_apollo_summarize_agent",
+        "_telegram_user",
+        "_telegram_bot",
+        "_organon",
+    )
+
     def __init__(self):
         self.persona = BASE_PERSONA
         self.powers = BASE_POWERS
         self.settings = BASE_SETTINGS
 
         self.clients = {}
-        self.model = self.powers.selected_model.value()
+        self.model = _get_model(self.powers.selected_model)
         self.agent = self.model.agent
 
-        self.apollo_summarize_agent = ApolloSummarizeAgent(
-            self.get_model(), self.get_persona(), self
-        )
-        self.telegram_user = TelegramAccountClient(self)
-        self.telegram_bot = TelegramBotClient(self)
+        # Agents, clients and the knowledge graph are built on first use
+        self._apollo_summarize_agent = None
+        self._telegram_user = None
+        self._telegram_bot = None
+        self._organon = None
+
+    @property
+    def apollo_summarize_agent(self) -> "ApolloSummarizeAgent":
+        if self._apollo_summarize_agent is None:
+            from src.athena.features.telegram.ai_services.agents import (
+                ApolloSummarizeAgent,
+            )
+
+            self._apollo_summarize_agent = ApolloSummarizeAgent(
+                self.get_model(), self.get_persona(), self
+            )
+        return self._apollo_summarize_agent
+
+    @property
+    def telegram_user(self) -> "TelegramAccountClient":
+        if self._telegram_user is None:
+            from src.athena.core.clients import TelegramAccountClient
+
+            self._telegram_user = TelegramAccountClient(self)
+        return self._telegram_user
+
+    @property
+    def telegram_bot(self) -> "TelegramBotClient":
+        if self._telegram_bot is None:
+            from src.athena.core.clients import TelegramBotClient
+
+            self._telegram_bot = TelegramBotClient(self)
+        return self._telegram_bot
 
-        self.organon = OrganonModel(self.get_model())
+    @property
+    def organon(self) -> "OrganonModel":
+        if self._organon is None:
+            from ...organon import OrganonModel
+
+            self._organon = OrganonModel(self.get_model())
+        return self._organon
 
     async def start(self):
         """
         Start the Deus client
         """
         try:
-            async_clients = []
-            for client in self.powers.selected_clients:
-                client_object = self._resolve_client_to_instance(client)
-                self.clients[client.name] = client_object
-                async_clients.append(client_object.start())
-
-            await asyncio.gather(*async_clients)  # Waits for all the clients to launch
+            clients = {
+                client.name: self._resolve_client_to_instance(client)
+                for client in self.powers.selected_clients
+            }
         except Exception as e:
             logger.error(f"Error starting clients: {e}")
             raise e
+        self.clients.update(clients)
+
+        # Clients start concurrently; let every start finish before failing
+        results = await asyncio.gather(
+            *(client.start() for client in clients.values()),
+            return_exceptions=True,
+        )
 
-    def get_apollo_object(self) -> ApolloSummarizeAgent:
+        errors = [result for result in results if isinstance(result, Exception)]
+        for error in errors:
+            logger.error(f"Error starting clients: {error}")
+        if errors:
+            raise errors[0]
+
+    async def stop(self):
+        """
+        Stop the Deus clients
+        """
+        results = await asyncio.gather(
+            *(client.stop() for client in self.clients.values()),
+            return_exceptions=True,
+        )
+        for client_name, result in zip(self.clients, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error stopping client {client_name}: {result}")
+        self.clients = {}
+
+    def get_apollo_object(self) -> "ApolloSummarizeAgent":
         """
         Get the Apollo object
         """
@@ -66,14 +162,10 @@ class Deus(DeusAbstract):
         """
         Resolve a client name to an instance
         """
-        response_dict = {
-            SupportedClients.TELEGRAM_USER: self.telegram_user,
-            SupportedClients.TELEGRAM_BOT: self.telegram_bot,
-        }
-        try:
-            return response_dict[client_name]
-        except KeyError:
+        attr = _CLIENT_ATTRS.get(client_name)
+        if attr is None:
             raise ValueError(f"Client {client_name} not found")
+        return getattr(self, attr)
 
     def format_template(self, string_to_format: str) -> str:
         """
@@ -82,7 +174,7 @@ class Deus(DeusAbstract):
         try:
             return self.persona.use_persona(string_to_format)
         except Exception as e:
-            self.logger.error(f"Error formatting template: {e}")
+            logger.error(f"Error formatting template: {e}")
             raise e
 
     def get_agent(self) -> Agent:
@@ -111,7 +203,7 @@ class Deus(DeusAbstract):
 
     def get_client(
         self, client_name: str
-    ) -> Union[TelegramAccountClient, TelegramBotClient]:
+    ) -> Union["TelegramAccountClient", "TelegramBotClient"]:
         """
         Get the client of the Deus instance
         """
@@ -124,31 +216,31 @@ class Deus(DeusAbstract):
         """
         Get the draft waiting time
         """
-        return self.settings.telegram_settings.BOT_DRAFT_WAITING_TIME
+        return self.settings.telegram.BOT_DRAFT_WAITING_TIME
 
     def get_telegram_draft_freshness_window(self) -> int:
         """
         Get the draft freshness window
         """
-        return self.settings.telegram_settings.BOT_DRAFT_FRESHNESS_WINDOW
+        return self.settings.telegram.BOT_DRAFT_FRESHNESS_WINDOW
 
     def get_telegram_message_batch_summary(self) -> int:
         """
         Get the message batch summary
         """
-        return self.settings.telegram_settings.MESSAGE_BATCH_SUMMARY_SIZE
+        return self.settings.telegram.MESSAGE_BATCH_SUMMARY_SIZE
 
     def get_telegram_message_batch_summary_hours(self) -> int:
         """
         Get the message batch summary hours
         """
-        return self.settings.telegram_settings.MESSAGE_BATCH_SUMMARY_HOURS
+        return self.settings.telegram.MESSAGE_BATCH_SUMMARY_HOURS
 
     def get_telegram_welcome_message(self) -> str:
         """
         Get the welcome message
         """
-        return self.settings.telegram_settings.BOT_WELCOME_MESSAGE
+        return self.settings.telegram.BOT_WELCOME_MESSAGE
 
     def get_organon(self):
         return self.organon
@@ -159,6 +251,8 @@ class DeusMaker(Deus):
     Maker class for creating Deus instances
     """
 
+    __slots__ = ()
+
     def __init__(self, persona: Persona, powers: Powers, settings: Settings):
         super().__init__()
         self.persona = persona
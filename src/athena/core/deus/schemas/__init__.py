@@ -1,18 +1,21 @@
-from .persona_schemas import Persona, StyleRules
+from .persona_schemas import MessageExample, Persona, StyleRules
 from .powers_schemas import (
     Powers,
     SupportedClients,
     SupportedModels,
+    resolve_model,
 )
 from .settings_schemas import Settings
 from .essence_schemas import Essence
 
 __all__ = [
+    "MessageExample",
     "Persona",
     "StyleRules",
     "Powers",
     "SupportedClients",
     "SupportedModels",
+    "resolve_model",
     "Settings",
     "Essence",
 ]
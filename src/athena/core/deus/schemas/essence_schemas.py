@@ -1,10 +1,12 @@
 from typing import Tuple
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from . import Persona, Powers, Settings
 
 
 class Essence(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     persona: Persona
     powers: Powers
     settings: Settings
@@ -1,42 +1,84 @@
+from functools import cached_property
 from typing import List, Optional
-from pydantic import BaseModel, Field, model_serializer
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    model_serializer,
+    model_validator,
+)
 
 from src.athena.core.utils import SafeFormatter
 
+# Formatters hold no state, so one instance serves every persona
+_SAFE_FORMATTER = SafeFormatter()
+
+
+class _SafeDict(dict):
+    """Leaves unknown placeholders in place when used with str.format_map"""
+
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
 
 class TextContent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     text: str
 
 
 class MessageExample(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user: str = Field(..., description="User name")
     content: TextContent = Field(..., description="Message content")
     action: Optional[str] = Field(
         None, description="Optional. Action to take on the message"
     )
 
+    # Rendered text, set once when the example is built
+    _rendered: str = PrivateAttr(default="")
+
+    @classmethod
+    def construct_from_dict(cls, data: dict) -> "MessageExample":
+        """Build from trusted literals, skipping validation"""
+        example = cls.model_construct(
+            user=data["user"],
+            content=TextContent.model_construct(**data["content"]),
+            action=data.get("action"),
+        )
+        return example._render()
+
+    @model_validator(mode="after")
+    def _render(self) -> "MessageExample":
+        self._rendered = f"User: {self.user}\nContent: {self.content.text}"
+        if self.action:
+            self._rendered += f"\nAction: {self.action}"
+        return self
+
     @model_serializer(mode="plain")
     def ser_message_example(self) -> str:
-        return f"User: {self.user}\nContent: {self.content.text}" + (
-            f"\nAction: {self.action}" if self.action else ""
-        )
+        return self._rendered
 
 
 class StyleRules(BaseModel):
-    general_style: List[str] = Field(
+    model_config = ConfigDict(frozen=True)
+
+    general_style: tuple[str, ...] = Field(
         ..., description="General style of the agent", min_length=1
     )
-    conversation_style: List[str] = Field(
+    conversation_style: tuple[str, ...] = Field(
         ..., description="Conversation style of the agent", min_length=1
     )
-    publication_style: List[str] = Field(
+    publication_style: tuple[str, ...] = Field(
         ..., description="Publication style of the agent", min_length=1
     )
 
     @model_serializer(mode="plain")
     def ser_style_rules(self) -> dict:
         return {
-            k: "\n".join(v) if isinstance(v, list) else v
+            k: "\n".join(v) if isinstance(v, (list, tuple)) else v
             for k, v in self.__dict__.items()
         }
 
@@ -46,43 +88,50 @@ class Persona(BaseModel):
     Persona represents the agent's or user's personality.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Agent name", default="Athena")
 
-    description: List[str] = Field(
+    description: tuple[str, ...] = Field(
         ...,
         description="Short snippets composed in random order to widen the possible outcomes",
         min_length=1,
     )
-    backstory: List[str] = Field(
+    backstory: tuple[str, ...] = Field(
         ..., description="Factual, extracted from messages/tweets/past engagement"
     )
 
-    adjectives: List[str] = Field(
+    adjectives: tuple[str, ...] = Field(
         ..., description="Adjectives that describe the agent's personality"
     )
-    topics: List[str] = Field(..., description="Topics that the agent can talk about")
+    topics: tuple[str, ...] = Field(
+        ..., description="Topics that the agent can talk about"
+    )
 
     conversation_examples: List[List[MessageExample]] = Field(
         ..., description="Examples of messages that the agent can handle"
     )
 
-    publications_examples: Optional[List[str]] = Field(
+    publications_examples: Optional[tuple[str, ...]] = Field(
         None, description="Examples of posts/tweets that the agent would post"
     )
 
     style_rules: StyleRules = Field(..., description="Rules for the agent's style")
 
+    # Serialized text of the persona, built on first use
+    _serialized_cache: dict | None = PrivateAttr(default=None)
+
     # serialize for text
     @model_serializer(mode="plain")
     def ser_persona(self) -> dict:
         return {
             "name": self.name,
-            "description": "\n".join(self.description),
-            "backstory": "\n".join(self.backstory),
-            "adjectives": ", ".join(self.adjectives),
-            "topics": ", ".join(self.topics),
+            "description": self._joined_description,
+            "backstory": self._joined_backstory,
+            "adjectives": self._joined_adjectives,
+            "topics": self._joined_topics,
             "conversation_examples": "\n\n".join(
-                "\n".join(str(e) for e in examples)
+                "\n".join(e._rendered for e in examples)
                 for examples in self.conversation_examples
             ),
             "publications_examples": (
@@ -90,11 +139,46 @@ class Persona(BaseModel):
                 if self.publications_examples
                 else None
             ),
-            "general_conversation": "\n".join(self.style_rules.general_style),
-            "conversation_style": "\n".join(self.style_rules.conversation_style),
-            "publication_style": "\n".join(self.style_rules.publication_style),
+            "general_conversation": self._joined_general_style,
+            "conversation_style": self._joined_conversation_style,
+            "publication_style": self._joined_publication_style,
         }
 
+    # Joined list fields, computed once per persona
+    @cached_property
+    def _joined_description(self) -> str:
+        return "\n".join(self.description)
+
+    @cached_property
+    def _joined_backstory(self) -> str:
+        return "\n".join(self.backstory)
+
+    @cached_property
+    def _joined_adjectives(self) -> str:
+        return ", ".join(self.adjectives)
+
+    @cached_property
+    def _joined_topics(self) -> str:
+        return ", ".join(self.topics)
+
+    @cached_property
+    def _joined_general_style(self) -> str:
+        return "\n".join(self.style_rules.general_style)
+
+    @cached_property
+    def _joined_conversation_style(self) -> str:
+        return "\n".join(self.style_rules.conversation_style)
+
+    @cached_property
+    def _joined_publication_style(self) -> str:
+        return "\n".join(self.style_rules.publication_style)
+
+    def get_rendered(self) -> dict:
+        """Serialized persona used to format templates, built once"""
+        if self._serialized_cache is None:
+            self._serialized_cache = _SafeDict(self.ser_persona())
+        return self._serialized_cache
+
     @classmethod
     def from_dict(cls, data: dict) -> "Persona":
         return cls(**data)
@@ -104,36 +188,39 @@ class Persona(BaseModel):
     """
 
     def use_persona(self, string_to_format: str) -> str:
-        formatter = SafeFormatter()
-        persona_data = self.ser_persona()
-        return formatter.format(string_to_format, **persona_data)
+        rendered = self.get_rendered()
+        try:
+            return string_to_format.format_map(rendered)
+        except (IndexError, KeyError, ValueError):
+            # Positional or indexed fields need the full formatter
+            return _SAFE_FORMATTER.format(string_to_format, **rendered)
 
     def get_name(self) -> str:
         return self.name
 
-    def get_description(self) -> List[str]:
+    def get_description(self) -> tuple[str, ...]:
         return self.description
 
-    def get_backstory(self) -> List[str]:
+    def get_backstory(self) -> tuple[str, ...]:
         return self.backstory
 
-    def get_adjectives(self) -> List[str]:
+    def get_adjectives(self) -> tuple[str, ...]:
         return self.adjectives
 
-    def get_topics(self) -> List[str]:
+    def get_topics(self) -> tuple[str, ...]:
         return self.topics
 
     def get_conversation_examples(self) -> List[List[MessageExample]]:
         return self.conversation_examples
 
-    def get_publications_examples(self) -> Optional[List[str]]:
+    def get_publications_examples(self) -> Optional[tuple[str, ...]]:
         return self.publications_examples
 
-    def get_general_conversation(self) -> List[str]:
+    def get_general_conversation(self) -> tuple[str, ...]:
         return self.style_rules.general_style
 
-    def get_conversation_style(self) -> List[str]:
+    def get_conversation_style(self) -> tuple[str, ...]:
         return self.style_rules.conversation_style
 
-    def get_publication_style(self) -> List[str]:
+    def get_publication_style(self) -> tuple[str, ...]:
         return self.style_rules.publication_style
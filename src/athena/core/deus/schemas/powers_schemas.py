@@ -2,20 +2,14 @@
 This file contains the schemas for the capabilities of an diety
 """
 
+import importlib
 from enum import Enum
-from pydantic import BaseModel, Field, model_validator
-from typing import List
+from functools import cache
+from pydantic import BaseModel, ConfigDict, Field
+from typing import TYPE_CHECKING, List
 
-from src.athena.core.ai_models.claude.claude_client import ClaudeLLM
-from src.athena.core.ai_models.deepseek.deepseek_client import DeepSeekLLM
-from src.athena.core.ai_models.gemini.gemini_client import GeminiLLM
-from src.athena.core.ai_models.groq.groq_client import GroqLLM
-from src.athena.core.ai_models.mistral.mistral_client import MistralLLM
-from src.athena.core.ai_models.ollama.ollama_client import OllamaLLM
-from src.athena.core.ai_models.openai.openai_client import OpenAILLM
-from src.athena.core.ai_models.openrouter.openrouter_client import OpenRouterLLM
-from src.athena.core.ai_models.xai.xai_client import xAILLM
-from src.athena.core.ai_models.vertexai.vertex_client import VertexLLM
+if TYPE_CHECKING:
+    from src.athena.core.ai_models import LLMBase
 
 
 class SupportedClients(Enum):
@@ -23,17 +17,40 @@ class SupportedClients(Enum):
     TELEGRAM_BOT = "TELEGRAM_BOT"
 
 
-class SupportedModels(Enum):
-    CLAUDE = ClaudeLLM
-    DEEPSEEK = DeepSeekLLM
-    GEMINI = GeminiLLM
-    GROQ = GroqLLM
-    MISTRAL = MistralLLM
-    OLLAMA = OllamaLLM
-    OPENAI = OpenAILLM
-    OPENROUTER = OpenRouterLLM
-    VERTEX = VertexLLM
-    XAI = xAILLM
+class SupportedModels(str, Enum):
+    CLAUDE = "CLAUDE"
+    DEEPSEEK = "DEEPSEEK"
+    GEMINI = "GEMINI"
+    GROQ = "GROQ"
+    MISTRAL = "MISTRAL"
+    OLLAMA = "OLLAMA"
+    OPENAI = "OPENAI"
+    OPENROUTER = "OPENROUTER"
+    VERTEX = "VERTEX"
+    XAI = "XAI"
+
+
+# Model clients are imported on first use so only the selected SDK is loaded
+_MODEL_REGISTRY = {
+    SupportedModels.CLAUDE: ("claude.claude_client", "ClaudeLLM"),
+    SupportedModels.DEEPSEEK: ("deepseek.deepseek_client", "DeepSeekLLM"),
+    SupportedModels.GEMINI: ("gemini.gemini_client", "GeminiLLM"),
+    SupportedModels.GROQ: ("groq.groq_client", "GroqLLM"),
+    SupportedModels.MISTRAL: ("mistral.mistral_client", "MistralLLM"),
+    SupportedModels.OLLAMA: ("ollama.ollama_client", "OllamaLLM"),
+    SupportedModels.OPENAI: ("openai.openai_client", "OpenAILLM"),
+    SupportedModels.OPENROUTER: ("openrouter.openrouter_client", "OpenRouterLLM"),
+    SupportedModels.VERTEX: ("vertexai.vertex_client", "VertexLLM"),
+    SupportedModels.XAI: ("xai.xai_client", "xAILLM"),
+}
+
+
+@cache
+def resolve_model(model: SupportedModels) -> type["LLMBase"]:
+    """Import and return the LLM client class of a supported model"""
+    module_name, class_name = _MODEL_REGISTRY[SupportedModels(model)]
+    module = importlib.import_module(f"src.athena.core.ai_models.{module_name}")
+    return getattr(module, class_name)
 
 
 class Powers(BaseModel):
@@ -41,23 +58,13 @@ class Powers(BaseModel):
     Powers represent the capabilities of the Pantheon diety
     """
 
+    model_config = ConfigDict(frozen=True)
+
     selected_clients: List[SupportedClients] = Field(
-        ..., description="Clients to use the persona"
+        ..., description="Clients to use the persona", min_length=1
     )
     selected_model: SupportedModels = Field(..., description="Model to use the persona")
 
-    @model_validator(mode="before")
-    def validate_selected_clients(cls, values):
-        selected_clients = values.get("selected_clients")
-        selected_model = values.get("selected_model")
-
-        if selected_clients is None or len(selected_clients) == 0:
-            raise ValueError("At least one client must be selected")
-        if selected_model is None:
-            raise ValueError("A model must be selected")
-
-        return values
-
     @classmethod
     def from_dict(cls, data: dict) -> "Powers":
         return cls(**data)
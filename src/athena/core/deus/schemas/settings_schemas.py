@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.athena.features.telegram.schemas.telegram_settings import TelegramSettings
 
@@ -8,16 +8,25 @@ class Settings(BaseModel):
     The settings for the persona and the powers
     """
 
+    model_config = ConfigDict(frozen=True)
+
     streaming_response: bool = Field(
         default=True,
         description="Whether to stream the response to the user",
     )
 
-    telegram_settings: TelegramSettings = Field(
-        default_factory=TelegramSettings,
+    telegram_settings: TelegramSettings | None = Field(
+        default=None,
         description="The settings for the telegram client",
     )
 
+    @property
+    def telegram(self) -> TelegramSettings:
+        """Telegram settings, built with their defaults on first access"""
+        if self.telegram_settings is None:
+            object.__setattr__(self, "telegram_settings", TelegramSettings())
+        return self.telegram_settings
+
     @classmethod
     def from_dict(cls, data: dict) -> "Settings":
         return cls(**data)
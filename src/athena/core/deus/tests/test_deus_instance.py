@@ -0,0 +1,49 @@
+from functools import cached_property
+from unittest.mock import patch
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+
+from src.athena.core.ai_models.shared import LLMBase, LLMConfig
+from src.athena.core.deus.base import base_instance
+from src.athena.core.deus.base.base_instance import Deus
+
+# The summarize agent pulls in the message processor's numeric stack
+pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+
+
+class FakeLLM(LLMBase):
+    """LLM client backed by pydantic_ai's offline test model"""
+
+    def __init__(self):
+        super().__init__(LLMConfig.model_construct(model_name="test", api_key="test"))
+
+    @property
+    def provider_name(self) -> str:
+        return "Fake"
+
+    @cached_property
+    def agent(self) -> Agent:
+        return Agent(model=TestModel(), name=self.provider_name)
+
+
+@pytest.fixture
+def shared_model():
+    """Resolve every model to FakeLLM, with a fresh shared-client cache."""
+    base_instance._get_model.cache_clear()
+    with patch.object(base_instance, "resolve_model", return_value=FakeLLM):
+        yield
+    base_instance._get_model.cache_clear()
+
+
+def test_summarize_prompt_registered_once(shared_model):
+    """Test that Deus sharing a model register the summary prompt once."""
+    first, second = Deus(), Deus()
+    assert first.get_model() is second.get_model()
+
+    first.get_apollo_object()
+    second.get_apollo_object()
+
+    assert len(first.get_agent()._system_prompt_functions) == 1
@@ -7,7 +7,7 @@ approach to define valid edge types between node types, reducing code duplicatio
 making the system more maintainable.
 
 The module defines:
-1. Edge relationship types as a Literal type
+1. Edge relationship types as a string enumeration
 2. A registry of valid edge definitions with their metadata
 3. Functions to dynamically generate Cypher queries for edge operations
 
@@ -15,38 +15,49 @@ This approach allows for a flexible, type-safe way to define and enforce valid
 relationships between different node types in the graph database.
 """
 
-from typing import Literal, NamedTuple
-
-# Define edge relationship types
-EdgeType = Literal[
-    "POSTED_IN",
-    "BELONGS_TO",
-    "RELATED_TO",
-    "MENTIONS",
-    "INCLUDES",
-    "PARTICIPATES_IN",
-    "HAS_PREFERENCE",
-    "FOR",
-    "EXPRESSES",
-]
-"""
-Literal type defining all valid relationship types in the Organon graph.
-
-Each relationship type represents a specific semantic connection between nodes:
-- POSTED_IN: A message or user posted in a room
-- BELONGS_TO: A message belongs to a cluster, or a user belongs to a room
-- RELATED_TO: A node is related to another node (topic, entity, etc.)
-- MENTIONS: A message mentions a user, entity, or topic
-- INCLUDES: A container node includes other nodes
-- PARTICIPATES_IN: A user participates in a room or event
-- HAS_PREFERENCE: A user has a specific preference
-- FOR: A node is intended for another node
-- EXPRESSES: A node expresses a sentiment or opinion
-"""
+from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType
+
+from .organon_node_op import NODE_DEFINITIONS, NodeType
+
+
+class EdgeType(str, Enum):
+    """
+    Enumeration of all valid relationship types in the Organon graph.
+
+    Members are strings, so they compare and hash equal to their Cypher names
+    and can be used interchangeably with them as registry keys.
+
+    Each relationship type represents a specific semantic connection between nodes:
+    - POSTED_IN: A message or user posted in a room
+    - BELONGS_TO: A message belongs to a cluster, or a user belongs to a room
+    - RELATED_TO: A node is related to another node (topic, entity, etc.)
+    - MENTIONS: A message mentions a user, entity, or topic
+    - INCLUDES: A container node includes other nodes
+    - PARTICIPATES_IN: A user participates in a room or event
+    - HAS_PREFERENCE: A user has a specific preference
+    - FOR: A node is intended for another node
+    - EXPRESSES: A node expresses a sentiment or opinion
+    """
+
+    POSTED_IN = "POSTED_IN"
+    BELONGS_TO = "BELONGS_TO"
+    RELATED_TO = "RELATED_TO"
+    MENTIONS = "MENTIONS"
+    INCLUDES = "INCLUDES"
+    PARTICIPATES_IN = "PARTICIPATES_IN"
+    HAS_PREFERENCE = "HAS_PREFERENCE"
+    FOR = "FOR"
+    EXPRESSES = "EXPRESSES"
+
+    # Render as the bare relationship name when interpolated into Cypher
+    __str__ = str.__str__
 
 
 # Define a structure to hold edge type metadata
-class EdgeDefinition(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class EdgeDefinition:
     """
     Data structure defining the metadata for a valid edge type between two node types.
 
@@ -57,36 +68,37 @@ class EdgeDefinition(NamedTuple):
         from_node_label: The label of the source node (e.g., "User")
         to_node_label: The label of the target node (e.g., "Room")
         relationship_type: The type of relationship (e.g., "POSTED_IN")
-        extra_props: Optional dictionary of extra properties to set on the relationship
-                    with their Cypher expressions for values
+        extra_props: (name, Cypher expression) pairs of extra properties to set
+                    on the relationship
     """
 
-    from_node_label: str
-    to_node_label: str
+    from_node_label: NodeType
+    to_node_label: NodeType
     relationship_type: EdgeType
-    extra_props: dict[str, str] | None = None
+    extra_props: tuple[tuple[str, str], ...] = ()
 
 
-# Registry of allowed edge definitions
-EDGE_DEFINITIONS = {
+# Extra relationship properties of each allowed edge
+_RAW_EDGES: dict[tuple[NodeType, NodeType, EdgeType], tuple[tuple[str, str], ...]] = {
     # Message edges
-    ("Message", "Room", "POSTED_IN"): EdgeDefinition("Message", "Room", "POSTED_IN"),
-    ("Message", "Cluster", "BELONGS_TO"): EdgeDefinition(
-        "Message", "Cluster", "BELONGS_TO"
-    ),
+    (NodeType.MESSAGE, NodeType.ROOM, EdgeType.POSTED_IN): (),
+    (NodeType.MESSAGE, NodeType.CLUSTER, EdgeType.BELONGS_TO): (),
     # User edges
-    ("User", "Room", "BELONGS_TO"): EdgeDefinition("User", "Room", "BELONGS_TO"),
-    ("User", "Room", "POSTED_IN"): EdgeDefinition(
-        "User", "Room", "POSTED_IN", {"count": "coalesce(p.count, 0) + 1"}
+    (NodeType.USER, NodeType.ROOM, EdgeType.BELONGS_TO): (),
+    (NodeType.USER, NodeType.ROOM, EdgeType.POSTED_IN): (
+        ("count", "coalesce(p.count, 0) + 1"),
     ),
-    ("User", "Topic", "RELATED_TO"): EdgeDefinition("User", "Topic", "RELATED_TO"),
+    (NodeType.USER, NodeType.TOPIC, EdgeType.RELATED_TO): (),
     # Cluster edges
-    ("Cluster", "Room", "RELATED_TO"): EdgeDefinition("Cluster", "Room", "RELATED_TO"),
-    ("Cluster", "Topic", "RELATED_TO"): EdgeDefinition(
-        "Cluster", "Topic", "RELATED_TO"
-    ),
+    (NodeType.CLUSTER, NodeType.ROOM, EdgeType.RELATED_TO): (),
+    (NodeType.CLUSTER, NodeType.TOPIC, EdgeType.RELATED_TO): (),
     # Room edges
-    ("Room", "Topic", "RELATED_TO"): EdgeDefinition("Room", "Topic", "RELATED_TO"),
+    (NodeType.ROOM, NodeType.TOPIC, EdgeType.RELATED_TO): (),
+}
+
+# Registry of allowed edge definitions
+EDGE_DEFINITIONS = {
+    key: EdgeDefinition(*key, extra_props) for key, extra_props in _RAW_EDGES.items()
 }
 """
 Registry of all valid edge definitions in the Organon graph.
@@ -103,9 +115,52 @@ Examples of valid relationships:
 - (Cluster, Topic, RELATED_TO): A message cluster is related to a topic
 """
 
+ALLOWED_EDGE_KEYS: frozenset[tuple[NodeType, NodeType, EdgeType]] = frozenset(
+    EDGE_DEFINITIONS
+)
+"""
+Keys of every registered edge. Bulk writers can filter candidate edges with a
+set membership test before asking for queries, instead of relying on the
+ValueError raised for unregistered edges.
+"""
+
+
+# Cypher identifier of each node label, as registered in NODE_DEFINITIONS
+_NODE_IDENTIFIERS = {
+    node_type: node_def.node_identifier
+    for node_type, node_def in NODE_DEFINITIONS.items()
+}
+
+
+def _edge_identifiers(
+    from_node_label: str, to_node_label: str, relationship_type: str
+) -> tuple[str, str, str]:
+    """
+    Pick distinct Cypher identifiers for the source node, target node and
+    relationship of an edge.
+
+    Nodes use their registered identifier and the relationship the first
+    lowercase letter of its type. Colliding names get a deterministic
+    tiebreak: "1"/"2" suffixes for the nodes (e.g. c1, c2 for Cluster ->
+    Community) and "rel" for the relationship (e.g. RELATED_TO -> Room).
+    """
+    from_id = _NODE_IDENTIFIERS[from_node_label]
+    to_id = _NODE_IDENTIFIERS[to_node_label]
+    if from_id == to_id:
+        from_id, to_id = f"{from_id}1", f"{to_id}2"
+
+    rel_id = relationship_type[0].lower()
+    if rel_id in (from_id, to_id):
+        rel_id = "rel"
+
+    return from_id, to_id, rel_id
+
 
 def generate_edge_query(
-    from_node_label: str, to_node_label: str, relationship_type: EdgeType
+    from_node_label: str,
+    to_node_label: str,
+    relationship_type: EdgeType,
+    batch: bool = False,
 ) -> str:
     """
     Generate a Cypher query for creating an edge between two nodes.
@@ -122,10 +177,14 @@ def generate_edge_query(
     4. Sets any additional properties defined for this relationship type
     5. Returns the source node, relationship, and target node
 
+    With `batch`, the query instead unwinds a `$rows` list whose entries carry
+    the same keys as the single-edge parameters, creating one edge per row.
+
     Args:
         from_node_label: The label of the source node (e.g., "User")
         to_node_label: The label of the target node (e.g., "Room")
         relationship_type: The type of relationship to create (e.g., "POSTED_IN")
+        batch: Whether to generate the UNWIND variant taking `$rows`
 
     Returns:
         A parameterized Cypher query string ready to be executed with parameters
@@ -138,63 +197,84 @@ def generate_edge_query(
         >>> # The query will look like:
         >>> # MATCH (u:User {uuid: $u_uuid}), (r:Room {uuid: $r_uuid})
         >>> # MERGE (u)-[p:POSTED_IN]->(r)
-        >>> # ON CREATE SET p.created_at = $created_at, p.updated_at = $updated_at, p.count = 1
+        >>> # ON CREATE SET p.created_at = $created_at, p.updated_at = $updated_at, p.count = coalesce(p.count, 0) + 1
         >>> # ON MATCH SET p.updated_at = $updated_at, p.count = coalesce(p.count, 0) + 1
         >>> # RETURN u, p, r
     """
     key = (from_node_label, to_node_label, relationship_type)
-    if key not in EDGE_DEFINITIONS:
+    edge_def = EDGE_DEFINITIONS.get(key)
+    if edge_def is None:
         raise ValueError(f"Unsupported edge definition: {key}")
 
-    edge_def = EDGE_DEFINITIONS[key]
+    from_id, to_id, rel_id = _edge_identifiers(
+        from_node_label, to_node_label, relationship_type
+    )
 
-    # Create node identifiers (first lowercase letter of each label)
-    from_id = from_node_label[0].lower()
-    to_id = to_node_label[0].lower()
-    rel_id = relationship_type[0].lower()
+    # Extra properties are set on both branches; their expressions are written
+    # to also hold for a fresh relationship (e.g. coalesce(p.count, 0) + 1)
+    extra_props = "".join(
+        f", {rel_id}.{prop_name} = {prop_value}"
+        for prop_name, prop_value in edge_def.extra_props
+    )
+
+    # Batch rows are read from the unwound row instead of query parameters
+    param = "row." if batch else "$"
+    unwind = "\n    UNWIND $rows AS row" if batch else ""
+
+    from_match = f"({from_id}:{from_node_label} {{uuid: {param}{from_id}_uuid}})"
+    to_match = f"({to_id}:{to_node_label} {{uuid: {param}{to_id}_uuid}})"
+    updated_at = f"{rel_id}.updated_at = {param}updated_at{extra_props}"
 
-    # Build base query
-    query = f"""
-    MATCH ({from_id}:{from_node_label} {{uuid: ${from_id}_uuid}}), ({to_id}:{to_node_label} {{uuid: ${to_id}_uuid}})
+    query = f"""{unwind}
+    MATCH {from_match}, {to_match}
     MERGE ({from_id})-[{rel_id}:{relationship_type}]->({to_id})
-    ON CREATE SET {rel_id}.created_at = $created_at, {rel_id}.updated_at = $updated_at
-    ON MATCH SET {rel_id}.updated_at = $updated_at
-    """
+    ON CREATE SET {rel_id}.created_at = {param}created_at, {updated_at}
+    ON MATCH SET {updated_at}
+    RETURN {from_id}, {rel_id}, {to_id}"""
 
-    # Add any extra properties
-    if edge_def.extra_props:
-        extra_props = []
-        for prop_name, prop_value in edge_def.extra_props.items():
-            extra_props.append(f"{rel_id}.{prop_name} = {prop_value}")
+    return query
 
-        if extra_props:
-            extra_props_str = ", ".join(extra_props)
-            query = query.replace(
-                "ON MATCH SET {rel_id}.updated_at = $updated_at",
-                f"ON MATCH SET {rel_id}.updated_at = $updated_at, {extra_props_str}",
-            )
 
-    # Add return statement
-    query += f"RETURN {from_id}, {rel_id}, {to_id}"
+# Every registered edge query, generated once at import
+_EDGE_QUERY_CACHE: dict[tuple[str, str, str], str] = {
+    key: generate_edge_query(*key) for key in EDGE_DEFINITIONS
+}
+
+_BATCH_EDGE_QUERY_CACHE: dict[tuple[str, str, str], str] = {
+    key: generate_edge_query(*key, batch=True) for key in EDGE_DEFINITIONS
+}
+
+EDGE_QUERIES = MappingProxyType(_EDGE_QUERY_CACHE)
+"""Read-only view of the generated query of every registered edge."""
+
+BATCH_EDGE_QUERIES = MappingProxyType(_BATCH_EDGE_QUERY_CACHE)
+"""Read-only view of the generated UNWIND query of every registered edge."""
 
-    return query
+
+# Identifiers of every registered edge, used to name the query parameters
+_EDGE_IDENTIFIERS: dict[tuple[str, str, str], tuple[str, str, str]] = {
+    key: _edge_identifiers(*key) for key in EDGE_DEFINITIONS
+}
 
 
 # --- Query generation functions for all edge types ---
 def get_edge_query(
-    from_node_label: str, to_node_label: str, relationship_type: EdgeType
+    from_node_label: str,
+    to_node_label: str,
+    relationship_type: EdgeType,
+    batch: bool = False,
 ) -> str:
     """
     Get the appropriate edge query for the given node labels and relationship type.
 
-    This is a convenience wrapper around generate_edge_query that provides a simpler
-    interface for getting edge queries. It's the main entry point for code that needs
-    to generate edge queries.
+    Queries for every registered edge are generated once at import, so this is a
+    single lookup. It's the main entry point for code that needs edge queries.
 
     Args:
         from_node_label: The label of the source node (e.g., "User")
         to_node_label: The label of the target node (e.g., "Room")
         relationship_type: The type of relationship to create (e.g., "POSTED_IN")
+        batch: Whether to get the UNWIND variant taking `$rows`
 
     Returns:
         A parameterized Cypher query string ready to be executed with parameters
@@ -202,7 +282,37 @@ def get_edge_query(
     Raises:
         ValueError: If the edge definition is not registered in EDGE_DEFINITIONS
     """
-    return generate_edge_query(from_node_label, to_node_label, relationship_type)
+    key = (from_node_label, to_node_label, relationship_type)
+    queries = _BATCH_EDGE_QUERY_CACHE if batch else _EDGE_QUERY_CACHE
+    try:
+        return queries[key]
+    except KeyError:
+        raise ValueError(f"Unsupported edge definition: {key}") from None
+
+
+def get_edge_uuid_params(
+    from_node_label: str, to_node_label: str, relationship_type: EdgeType
+) -> tuple[str, str]:
+    """
+    Get the names of the source and target UUID parameters of an edge query.
+
+    Args:
+        from_node_label: The label of the source node (e.g., "User")
+        to_node_label: The label of the target node (e.g., "Room")
+        relationship_type: The type of relationship (e.g., "POSTED_IN")
+
+    Returns:
+        The source and target parameter names (e.g., ("u_uuid", "r_uuid"))
+
+    Raises:
+        ValueError: If the edge definition is not registered in EDGE_DEFINITIONS
+    """
+    key = (from_node_label, to_node_label, relationship_type)
+    try:
+        from_id, to_id, _ = _EDGE_IDENTIFIERS[key]
+    except KeyError:
+        raise ValueError(f"Unsupported edge definition: {key}") from None
+    return f"{from_id}_uuid", f"{to_id}_uuid"
 
 
 # For backward compatibility, define the previously hardcoded queries
@@ -1,56 +1,52 @@
-ORGANON_INIT_QUERIES = [
-    # # --- Node Constraints (Uniqueness) ---
-    # # User: user_id is globally unique (we'll handle generation)
-    # "CREATE CONSTRAINT user_user_id_unique IF NOT EXISTS FOR (u:User) REQUIRE u.user_id IS UNIQUE",
-    # # Room: room_id is globally unique
-    # "CREATE CONSTRAINT room_room_id_unique IF NOT EXISTS FOR (r:Room) REQUIRE r.room_id IS UNIQUE",
-    # # Message: message_id is globally unique
-    # "CREATE CONSTRAINT message_message_id_unique IF NOT EXISTS FOR (m:Message) REQUIRE m.message_id IS UNIQUE",
-    # # Cluster: cluster_id is globally unique
-    # "CREATE CONSTRAINT cluster_cluster_id_unique IF NOT EXISTS FOR (c:Cluster) REQUIRE c.cluster_id IS UNIQUE",
-    # # Community: community_id is globally unique
-    # "CREATE CONSTRAINT community_community_id_unique IF NOT EXISTS FOR (c:Community) REQUIRE c.community_id IS UNIQUE",
-    # # Entity: uuid is globally unique
-    # "CREATE CONSTRAINT entity_uuid_unique IF NOT EXISTS FOR (e:Entity) REQUIRE e.uuid IS UNIQUE",
-    # # Preference: preference_id is globally unique
-    # "CREATE CONSTRAINT preference_preference_id_unique IF NOT EXISTS FOR (p:Preference) REQUIRE p.preference_id IS UNIQUE",
-    # # --- Node Indexes ---
-    # "CREATE INDEX user_user_id_index IF NOT EXISTS FOR (u:User) ON (u.user_id)",
-    # "CREATE INDEX room_room_id_index IF NOT EXISTS FOR (r:Room) ON (r.room_id)",
-    # "CREATE INDEX message_message_id_index IF NOT EXISTS FOR (m:Message) ON (m.message_id)",
-    # "CREATE INDEX message_date_index IF NOT EXISTS FOR (m:Message) ON (m.created_at)",
-    # "CREATE INDEX room_type_index IF NOT EXISTS FOR (r:Room) ON (r.room_type)",
-    # "CREATE INDEX room_platform_index IF NOT EXISTS FOR (r:Room) ON (r.platform)",
-    # "CREATE INDEX message_platform_index IF NOT EXISTS FOR (m:Message) ON (m.platform)",
-    # "CREATE INDEX community_community_id_index IF NOT EXISTS FOR (c:Community) ON (c.community_id)",
-    # # --- Vector Index (for Message Embeddings) ---
-    # """
-    #             CREATE VECTOR INDEX message_embeddings IF NOT EXISTS
-    #             FOR (m:Message) ON (m.embedding)
-    #             OPTIONS {
-    #                 indexConfig: {
-    #                     `vector.similarity_function`: 'cosine'
-    #                 }
-    #             }
-    #         """,
-    # # --- Vector Index (for Entity Name Embeddings) ---
-    # """
-    #             CREATE VECTOR INDEX entity_name_embeddings IF NOT EXISTS
-    #             FOR (e:Entity) ON (e.embedding)
-    #             OPTIONS {indexConfig: {
-    #                 `vector.similarity_function`: 'cosine'
-    #             }}
-    #         """,
-    # # --- Vector Index (for Preference description Embeddings) ---
-    # """
-    #             CREATE VECTOR INDEX preference_description_embeddings IF NOT EXISTS
-    #             FOR (p:Preference) ON (p.embedding)
-    #             OPTIONS {indexConfig: {
-    #                 `vector.similarity_function`: 'cosine'
-    #             }}
-    #         """,
+from .organon_node_op import NODE_DEFINITIONS
+
+# Every generated node and edge query looks nodes up by uuid, so a uniqueness
+# constraint (and its backing index) on uuid per label turns those label scans
+# into index seeks. Other properties are not filtered on by generated queries.
+UUID_CONSTRAINT_QUERIES = [
+    f"CREATE CONSTRAINT {node_type.lower()}_uuid_unique IF NOT EXISTS "
+    f"FOR ({node_def.node_identifier}:{node_type}) "
+    f"REQUIRE {node_def.node_identifier}.uuid IS UNIQUE"
+    for node_type, node_def in NODE_DEFINITIONS.items()
+]
+
+# Messages are looked up by the room they were posted in when walking a
+# room's history, which is a range over room_id rather than a uuid seek
+PROPERTY_INDEX_QUERIES = [
+    "CREATE INDEX message_room_id IF NOT EXISTS FOR (m:Message) ON (m.room_id)",
 ]
 
+VECTOR_INDEX_QUERIES = [
+    # --- Vector Index (for Message Embeddings) ---
+    """
+    CREATE VECTOR INDEX message_embeddings IF NOT EXISTS
+    FOR (m:Message) ON (m.embedding)
+    OPTIONS {indexConfig: {
+        `vector.similarity_function`: 'cosine'
+    }}
+    """,
+    # --- Vector Index (for Entity Name Embeddings) ---
+    """
+    CREATE VECTOR INDEX entity_name_embeddings IF NOT EXISTS
+    FOR (e:Entity) ON (e.embedding)
+    OPTIONS {indexConfig: {
+        `vector.similarity_function`: 'cosine'
+    }}
+    """,
+    # --- Vector Index (for Preference description Embeddings) ---
+    """
+    CREATE VECTOR INDEX preference_description_embeddings IF NOT EXISTS
+    FOR (p:Preference) ON (p.embedding)
+    OPTIONS {indexConfig: {
+        `vector.similarity_function`: 'cosine'
+    }}
+    """,
+]
+
+ORGANON_INIT_QUERIES = (
+    UUID_CONSTRAINT_QUERIES + PROPERTY_INDEX_QUERIES + VECTOR_INDEX_QUERIES
+)
+
 CLEAR_ORGANON_QUERIES = [
     "MATCH (n) DETACH DELETE n",
 ]
@@ -58,5 +54,16 @@ CLEAR_ORGANON_QUERIES = [
 GET_INDEXES_QUERY = "SHOW INDEXES"
 GET_CONSTRAINTS_QUERY = "SHOW CONSTRAINTS"
 
-DROP_INDEX_QUERY = "DROP INDEX {name} IF EXISTS"
-DROP_CONSTRAINT_QUERY = "DROP CONSTRAINT {name} IF EXISTS"
+
+def _quote_name(name: str) -> str:
+    # Backtick-quote so names read back from SHOW output cannot inject Cypher
+    escaped = name.replace("`", "``")
+    return f"`{escaped}`"
+
+
+def drop_index_query(name: str) -> str:
+    return f"DROP INDEX {_quote_name(name)} IF EXISTS"
+
+
+def drop_constraint_query(name: str) -> str:
+    return f"DROP CONSTRAINT {_quote_name(name)} IF EXISTS"
@@ -15,32 +15,42 @@ This approach allows for a flexible, type-safe way to define and enforce node pr
 in the graph database.
 """
 
-from typing import Literal, NamedTuple
-
-# Define node types
-NodeType = Literal[
-    "User",
-    "Room",
-    "Message",
-    "Cluster",
-    "Community",
-    "Entity",
-    "Topic",
-    "Preference",
-]
-"""
-Literal type defining all valid node types in the Organon graph.
-
-Each node type represents a specific entity in the graph database:
-- User: A user in the system
-- Room: A chat room or conversation space
-- Message: An individual message sent by a user
-- Cluster: A group of related messages
-- Community: A group of related rooms
-- Entity: A named entity mentioned in messages
-- Topic: A subject or theme discussed in messages
-- Preference: A user preference or setting
-"""
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+class NodeType(str, Enum):
+    """
+    Enumeration of all valid node types in the Organon graph.
+
+    Members are strings, so they compare and hash equal to their Neo4j labels
+    and can be used interchangeably with them as registry keys.
+
+    Each node type represents a specific entity in the graph database:
+    - User: A user in the system
+    - Room: A chat room or conversation space
+    - Message: An individual message sent by a user
+    - Cluster: A group of related messages
+    - Community: A group of related rooms
+    - Entity: A named entity mentioned in messages
+    - Topic: A subject or theme discussed in messages
+    - Preference: A user preference or setting
+    """
+
+    USER = "User"
+    ROOM = "Room"
+    MESSAGE = "Message"
+    CLUSTER = "Cluster"
+    COMMUNITY = "Community"
+    ENTITY = "Entity"
+    TOPIC = "Topic"
+    PREFERENCE = "Preference"
+
+    # Render as the bare label when interpolated into Cypher
+    __str__ = str.__str__
 
 
 class NodeProperty(NamedTuple):
@@ -51,14 +61,20 @@ class NodeProperty(NamedTuple):
         name: The name of the property
         required: Whether the property is required (always included in queries)
         default: Optional default value expression in Cypher
+        vector: Whether the property is a vector embedding. Vector properties
+            are left out of the property maps and stored through
+            db.create.setNodeVectorProperty, which keeps them as float32
+            arrays instead of the float64 lists a plain SET would write
     """
 
     name: str
     required: bool = True
     default: str | None = None
+    vector: bool = False
 
 
-class NodeDefinition(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class NodeDefinition:
     """
     Data structure defining the metadata for a node type.
 
@@ -68,112 +84,155 @@ class NodeDefinition(NamedTuple):
     Attributes:
         node_type: The type of node (e.g., "User")
         node_identifier: The identifier used in Cypher queries (e.g., "u")
-        properties: List of properties for this node type
+        properties: Tuple of properties for this node type
+        props_cypher: Cypher map entries assigning every property from its parameter
+        match_props_cypher: Map entries updated on an existing node, which
+            leave out the properties in ON_MATCH_EXCLUDE
+        required_props_cypher: Map entries for the required properties only
+        optional_props_cypher: Map entries for the optional properties only
+        vector_props: Names of the vector embedding properties
     """
 
     node_type: NodeType
     node_identifier: str
-    properties: list[NodeProperty]
+    properties: tuple[NodeProperty, ...]
+    props_cypher: str
+    match_props_cypher: str
+    required_props_cypher: str
+    optional_props_cypher: str
+    vector_props: tuple[str, ...]
+
+
+ON_MATCH_EXCLUDE: frozenset[str] = frozenset({"created_at"})
+"""
+Properties only written when a node is created, so updating an existing node
+keeps its original creation time.
+"""
+
+
+def _props_cypher(properties: Iterable[NodeProperty]) -> str:
+    return ", ".join(f"{prop.name}: ${prop.name}" for prop in properties)
+
+
+def _build_node_def(
+    node_type: NodeType, node_identifier: str, properties: tuple[NodeProperty, ...]
+) -> NodeDefinition:
+    """
+    Build a NodeDefinition with its Cypher property fragments precomputed.
+    """
+    plain = tuple(p for p in properties if not p.vector)
+    return NodeDefinition(
+        node_type=node_type,
+        node_identifier=node_identifier,
+        properties=properties,
+        props_cypher=_props_cypher(plain),
+        match_props_cypher=_props_cypher(
+            p for p in plain if p.name not in ON_MATCH_EXCLUDE
+        ),
+        required_props_cypher=_props_cypher(p for p in plain if p.required),
+        optional_props_cypher=_props_cypher(p for p in plain if not p.required),
+        vector_props=tuple(p.name for p in properties if p.vector),
+    )
 
 
 # Common properties for all node types
-COMMON_PROPERTIES = [
+COMMON_PROPERTIES: tuple[NodeProperty, ...] = (
     NodeProperty("uuid"),
     NodeProperty("name"),
     NodeProperty("platform"),
     NodeProperty("created_at"),
     NodeProperty("updated_at"),
-]
+)
 
 
 # Registry of node definitions
-NODE_DEFINITIONS = {
-    "User": NodeDefinition(
-        node_type="User",
+NODE_DEFINITIONS: dict[NodeType, NodeDefinition] = {
+    NodeType.USER: _build_node_def(
+        node_type=NodeType.USER,
         node_identifier="u",
         properties=COMMON_PROPERTIES
-        + [
+        + (
             NodeProperty("user_id"),
             NodeProperty("platform_handles"),
             NodeProperty("summary", required=False),
             NodeProperty("classification", required=False),
             NodeProperty("last_summary_update", required=False),
-        ],
+        ),
     ),
-    "Room": NodeDefinition(
-        node_type="Room",
+    NodeType.ROOM: _build_node_def(
+        node_type=NodeType.ROOM,
         node_identifier="r",
         properties=COMMON_PROPERTIES
-        + [
+        + (
             NodeProperty("room_id"),
             NodeProperty("room_type"),
             NodeProperty("community_id", required=False),
             NodeProperty("summary", required=False),
-        ],
+        ),
     ),
-    "Message": NodeDefinition(
-        node_type="Message",
+    NodeType.MESSAGE: _build_node_def(
+        node_type=NodeType.MESSAGE,
         node_identifier="m",
         properties=COMMON_PROPERTIES
-        + [
+        + (
             NodeProperty("message_id"),
             NodeProperty("room_id"),
             NodeProperty("user_id"),
             NodeProperty("content"),
             NodeProperty("engagement_score", required=False),
-            NodeProperty("embedding", required=False),
-        ],
+            NodeProperty("embedding", required=False, vector=True),
+        ),
     ),
-    "Cluster": NodeDefinition(
-        node_type="Cluster",
+    NodeType.CLUSTER: _build_node_def(
+        node_type=NodeType.CLUSTER,
         node_identifier="c",
         properties=COMMON_PROPERTIES
-        + [
+        + (
             NodeProperty("room_id"),
             NodeProperty("start_time"),
             NodeProperty("end_time"),
             NodeProperty("keywords"),
             NodeProperty("messages"),
             NodeProperty("embeddings", required=False),
-        ],
+        ),
     ),
-    "Community": NodeDefinition(
-        node_type="Community",
+    NodeType.COMMUNITY: _build_node_def(
+        node_type=NodeType.COMMUNITY,
         node_identifier="c",
         properties=COMMON_PROPERTIES
-        + [
+        + (
             NodeProperty("community_id"),
             NodeProperty("description"),
-        ],
+        ),
     ),
-    "Entity": NodeDefinition(
-        node_type="Entity",
+    NodeType.ENTITY: _build_node_def(
+        node_type=NodeType.ENTITY,
         node_identifier="e",
         properties=COMMON_PROPERTIES
-        + [
+        + (
             NodeProperty("entity_type"),
-            NodeProperty("embedding", required=False),
-        ],
+            NodeProperty("embedding", required=False, vector=True),
+        ),
     ),
-    "Topic": NodeDefinition(
-        node_type="Topic",
+    NodeType.TOPIC: _build_node_def(
+        node_type=NodeType.TOPIC,
         node_identifier="t",
         properties=COMMON_PROPERTIES
-        + [
+        + (
             NodeProperty("description"),
-            NodeProperty("embedding", required=False),
-        ],
+            NodeProperty("embedding", required=False, vector=True),
+        ),
     ),
-    "Preference": NodeDefinition(
-        node_type="Preference",
+    NodeType.PREFERENCE: _build_node_def(
+        node_type=NodeType.PREFERENCE,
         node_identifier="p",
         properties=COMMON_PROPERTIES
-        + [
+        + (
             NodeProperty("preference_id"),
             NodeProperty("preference_type"),
             NodeProperty("description"),
-            NodeProperty("embedding", required=False),
-        ],
+            NodeProperty("embedding", required=False, vector=True),
+        ),
     ),
 }
 """
@@ -186,6 +245,11 @@ The registry serves as both documentation of node types and as a
 runtime mechanism to generate Cypher queries for node operations.
 """
 
+ALLOWED_NODE_TYPES: frozenset[NodeType] = frozenset(NODE_DEFINITIONS)
+"""
+Every registered node type, for set membership checks in bulk validators.
+"""
+
 
 def generate_create_node_query(node_type: NodeType) -> str:
     """
@@ -204,36 +268,19 @@ def generate_create_node_query(node_type: NodeType) -> str:
     Raises:
         ValueError: If the node type is not registered in NODE_DEFINITIONS
     """
-    if node_type not in NODE_DEFINITIONS:
+    node_def = NODE_DEFINITIONS.get(node_type)
+    if node_def is None:
         raise ValueError(f"Unsupported node type: {node_type}")
-
-    node_def = NODE_DEFINITIONS[node_type]
     identifier = node_def.node_identifier
 
-    # Build property assignments for CREATE and MATCH operations
-    create_props = []
-    match_props = []
-
-    for prop in node_def.properties:
-        if prop.required:
-            create_props.append(f"{prop.name}: ${prop.name}")
-            match_props.append(f"{prop.name}: ${prop.name}")
-        else:
-            # Optional properties use a different pattern
-            create_props.append(f"{prop.name}: ${prop.name}")
-            match_props.append(f"{prop.name}: ${prop.name}")
-
-    create_props_str = ", ".join(create_props)
-    match_props_str = ", ".join(match_props)
-
     # Build the query
     query = f"""
 MERGE ({identifier}:{node_type} {{uuid: $uuid}})
 ON CREATE SET {identifier} = {{
-    {create_props_str}
+    {node_def.props_cypher}
 }}
 ON MATCH SET {identifier} += {{
-    {match_props_str}
+    {node_def.match_props_cypher}
 }}
 RETURN {identifier}
 """
@@ -241,27 +288,54 @@ RETURN {identifier}
     return query
 
 
-def generate_fetch_node_query(node_type: NodeType) -> str:
+def generate_batch_create_node_query(node_type: NodeType) -> str:
     """
-    Generate a Cypher query for fetching a node by UUID.
+    Generate a Cypher query for creating or updating many nodes at once.
+
+    The query takes a `$rows` list of parameter maps, shaped like the
+    parameters of the single-node create query, and MERGEs one node per row
+    so a whole batch costs a single round-trip.
 
     Args:
-        node_type: The type of node to fetch (e.g., "User")
+        node_type: The type of node to create (e.g., "User")
 
     Returns:
-        A parameterized Cypher query string ready to be executed with parameters
+        A parameterized Cypher query string ready to be executed with `rows`
 
     Raises:
         ValueError: If the node type is not registered in NODE_DEFINITIONS
     """
-    if node_type not in NODE_DEFINITIONS:
+    node_def = NODE_DEFINITIONS.get(node_type)
+    if node_def is None:
         raise ValueError(f"Unsupported node type: {node_type}")
-
-    node_def = NODE_DEFINITIONS[node_type]
     identifier = node_def.node_identifier
 
+    # Missing optional keys read as null instead of failing the whole batch
+    plain = [prop.name for prop in node_def.properties if not prop.vector]
+    props_str = ", ".join(f"{name}: row.{name}" for name in plain)
+    match_props_str = ", ".join(
+        f"{name}: row.{name}" for name in plain if name not in ON_MATCH_EXCLUDE
+    )
+    # Rows without a vector skip the procedure call but still return the node
+    vectors_str = "".join(
+        f"""
+CALL {{
+    WITH {identifier}, row
+    WITH {identifier}, row WHERE row.{name} IS NOT NULL
+    CALL db.create.setNodeVectorProperty({identifier}, '{name}', row.{name})
+}}"""
+        for name in node_def.vector_props
+    )
+
     query = f"""
-MATCH ({identifier}:{node_type} {{uuid: $uuid}})
+UNWIND $rows AS row
+MERGE ({identifier}:{node_def.node_type} {{uuid: row.uuid}})
+ON CREATE SET {identifier} = {{
+    {props_str}
+}}
+ON MATCH SET {identifier} += {{
+    {match_props_str}
+}}{vectors_str}
 RETURN {identifier}
 """
 
@@ -272,6 +346,9 @@ def generate_fetch_nodes_query(node_type: NodeType) -> str:
     """
     Generate a Cypher query for fetching multiple nodes by UUIDs.
 
+    The uuids are unwound so each one is matched with its own index seek on
+    the uuid constraint rather than a label scan filtered by IN.
+
     Args:
         node_type: The type of nodes to fetch (e.g., "User")
 
@@ -281,107 +358,78 @@ def generate_fetch_nodes_query(node_type: NodeType) -> str:
     Raises:
         ValueError: If the node type is not registered in NODE_DEFINITIONS
     """
-    if node_type not in NODE_DEFINITIONS:
+    node_def = NODE_DEFINITIONS.get(node_type)
+    if node_def is None:
         raise ValueError(f"Unsupported node type: {node_type}")
-
-    node_def = NODE_DEFINITIONS[node_type]
     identifier = node_def.node_identifier
 
     query = f"""
-MATCH ({identifier}:{node_type})
-WHERE {identifier}.uuid IN $uuids
+UNWIND $uuids AS uuid
+MATCH ({identifier}:{node_type} {{uuid: uuid}})
 RETURN {identifier}
 """
 
     return query
 
 
-# --- Create Queries ---
-CREATE_USER_NODE_QUERY = generate_create_node_query("User")
-CREATE_ROOM_NODE_QUERY = generate_create_node_query("Room")
-CREATE_MESSAGE_NODE_QUERY = generate_create_node_query("Message")
-CREATE_CLUSTER_NODE_QUERY = generate_create_node_query("Cluster")
-CREATE_COMMUNITY_NODE_QUERY = generate_create_node_query("Community")
-CREATE_ENTITY_NODE_QUERY = generate_create_node_query("Entity")
-CREATE_TOPIC_NODE_QUERY = generate_create_node_query("Topic")
-CREATE_PREFERENCE_NODE_QUERY = generate_create_node_query("Preference")
-
-# --- Fetch Queries ---
-FETCH_USER_NODE_QUERY = generate_fetch_node_query("User")
-FETCH_ROOM_NODE_QUERY = generate_fetch_node_query("Room")
-FETCH_MESSAGE_NODE_QUERY = generate_fetch_node_query("Message")
-FETCH_CLUSTER_NODE_QUERY = generate_fetch_node_query("Cluster")
-FETCH_COMMUNITY_NODE_QUERY = generate_fetch_node_query("Community")
-FETCH_ENTITY_NODE_QUERY = generate_fetch_node_query("Entity")
-FETCH_TOPIC_NODE_QUERY = generate_fetch_node_query("Topic")
-FETCH_PREFERENCE_NODE_QUERY = generate_fetch_node_query("Preference")
-
-# --- Fetch Multiple Queries ---
-FETCH_USERS_NODE_QUERY = generate_fetch_nodes_query("User")
-FETCH_ROOMS_NODE_QUERY = generate_fetch_nodes_query("Room")
-FETCH_MESSAGES_NODE_QUERY = generate_fetch_nodes_query("Message")
-FETCH_CLUSTERS_NODE_QUERY = generate_fetch_nodes_query("Cluster")
-FETCH_COMMUNITIES_NODE_QUERY = generate_fetch_nodes_query("Community")
-FETCH_ENTITIES_NODE_QUERY = generate_fetch_nodes_query("Entity")
-FETCH_TOPICS_NODE_QUERY = generate_fetch_nodes_query("Topic")
-FETCH_PREFERENCES_NODE_QUERY = generate_fetch_nodes_query("Preference")
-
-
-# Main entry point for getting node creation queries
-def get_create_node_query(node_type: NodeType) -> str:
-    """
-    Get the appropriate node creation query for the given node type.
-
-    This is a convenience wrapper around generate_create_node_query that
-    provides a simpler interface for getting node creation queries.
-
-    Args:
-        node_type: The type of node to create (e.g., "User")
-
-    Returns:
-        A parameterized Cypher query string ready to be executed with parameters
-
-    Raises:
-        ValueError: If the node type is not registered in NODE_DEFINITIONS
-    """
-    return generate_create_node_query(node_type)
-
-
-# Main entry point for getting node fetch queries
-def get_fetch_node_query(node_type: NodeType) -> str:
-    """
-    Get the appropriate node fetch query for the given node type.
-
-    This is a convenience wrapper around generate_fetch_node_query that
-    provides a simpler interface for getting node fetch queries.
-
-    Args:
-        node_type: The type of node to fetch (e.g., "User")
+class _NodeQueries(dict[str, str]):
+    """Query table raising ValueError for unregistered node types"""
 
-    Returns:
-        A parameterized Cypher query string ready to be executed with parameters
-
-    Raises:
-        ValueError: If the node type is not registered in NODE_DEFINITIONS
-    """
-    return generate_fetch_node_query(node_type)
+    def __missing__(self, node_type: str) -> str:
+        raise ValueError(f"Unsupported node type: {node_type}")
 
 
-# Main entry point for getting multi-node fetch queries
-def get_fetch_nodes_query(node_type: NodeType) -> str:
-    """
-    Get the appropriate multi-node fetch query for the given node type.
+# Every registered node query, generated once at import
+_CREATE_NODE_QUERIES = _NodeQueries(
+    (node_type, generate_create_node_query(node_type)) for node_type in NODE_DEFINITIONS
+)
+_BATCH_CREATE_NODE_QUERIES = _NodeQueries(
+    (node_type, generate_batch_create_node_query(node_type))
+    for node_type in NODE_DEFINITIONS
+)
+_FETCH_NODES_QUERIES = _NodeQueries(
+    (node_type, generate_fetch_nodes_query(node_type)) for node_type in NODE_DEFINITIONS
+)
 
-    This is a convenience wrapper around generate_fetch_nodes_query that
-    provides a simpler interface for getting multi-node fetch queries.
+# Read-only views of the generated queries of every registered node type
+CREATE_NODE_QUERIES = MappingProxyType(_CREATE_NODE_QUERIES)
+BATCH_CREATE_NODE_QUERIES = MappingProxyType(_BATCH_CREATE_NODE_QUERIES)
+FETCH_NODES_QUERIES = MappingProxyType(_FETCH_NODES_QUERIES)
 
-    Args:
-        node_type: The type of nodes to fetch (e.g., "User")
-
-    Returns:
-        A parameterized Cypher query string ready to be executed with parameters
+# --- Create Queries ---
+CREATE_USER_NODE_QUERY = _CREATE_NODE_QUERIES["User"]
+CREATE_ROOM_NODE_QUERY = _CREATE_NODE_QUERIES["Room"]
+CREATE_MESSAGE_NODE_QUERY = _CREATE_NODE_QUERIES["Message"]
+CREATE_CLUSTER_NODE_QUERY = _CREATE_NODE_QUERIES["Cluster"]
+CREATE_COMMUNITY_NODE_QUERY = _CREATE_NODE_QUERIES["Community"]
+CREATE_ENTITY_NODE_QUERY = _CREATE_NODE_QUERIES["Entity"]
+CREATE_TOPIC_NODE_QUERY = _CREATE_NODE_QUERIES["Topic"]
+CREATE_PREFERENCE_NODE_QUERY = _CREATE_NODE_QUERIES["Preference"]
+
+# --- Batch Create Queries ---
+BATCH_CREATE_USER_NODE_QUERY = _BATCH_CREATE_NODE_QUERIES["User"]
+BATCH_CREATE_ROOM_NODE_QUERY = _BATCH_CREATE_NODE_QUERIES["Room"]
+BATCH_CREATE_MESSAGE_NODE_QUERY = _BATCH_CREATE_NODE_QUERIES["Message"]
+BATCH_CREATE_CLUSTER_NODE_QUERY = _BATCH_CREATE_NODE_QUERIES["Cluster"]
+BATCH_CREATE_COMMUNITY_NODE_QUERY = _BATCH_CREATE_NODE_QUERIES["Community"]
+BATCH_CREATE_ENTITY_NODE_QUERY = _BATCH_CREATE_NODE_QUERIES["Entity"]
+BATCH_CREATE_TOPIC_NODE_QUERY = _BATCH_CREATE_NODE_QUERIES["Topic"]
+BATCH_CREATE_PREFERENCE_NODE_QUERY = _BATCH_CREATE_NODE_QUERIES["Preference"]
 
-    Raises:
-        ValueError: If the node type is not registered in NODE_DEFINITIONS
-    """
-    return generate_fetch_nodes_query(node_type)
+# --- Fetch Multiple Queries ---
+FETCH_USERS_NODE_QUERY = _FETCH_NODES_QUERIES["User"]
+FETCH_ROOMS_NODE_QUERY = _FETCH_NODES_QUERIES["Room"]
+FETCH_MESSAGES_NODE_QUERY = _FETCH_NODES_QUERIES["Message"]
+FETCH_CLUSTERS_NODE_QUERY = _FETCH_NODES_QUERIES["Cluster"]
+FETCH_COMMUNITIES_NODE_QUERY = _FETCH_NODES_QUERIES["Community"]
+FETCH_ENTITIES_NODE_QUERY = _FETCH_NODES_QUERIES["Entity"]
+FETCH_TOPICS_NODE_QUERY = _FETCH_NODES_QUERIES["Topic"]
+FETCH_PREFERENCES_NODE_QUERY = _FETCH_NODES_QUERIES["Preference"]
+
+
+# Main entry points for getting node queries. Each takes a node type
+# (e.g. "User"), returns the parameterized Cypher query for it, and raises
+# ValueError if the node type is not registered in NODE_DEFINITIONS.
+get_create_node_query = _CREATE_NODE_QUERIES.__getitem__
+get_batch_create_node_query = _BATCH_CREATE_NODE_QUERIES.__getitem__
+get_fetch_nodes_query = _FETCH_NODES_QUERIES.__getitem__
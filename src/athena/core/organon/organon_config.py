@@ -1,3 +1,5 @@
+from functools import cache
+
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,6 +15,17 @@ class OrganonConnectionSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="ORGANON_")
 
 
+@cache
+def get_connection_settings() -> OrganonConnectionSettings:
+    """Connection settings read from the environment once per process."""
+    return OrganonConnectionSettings()
+
+
 class OrganonConfig(BaseModel):
     SEMAPHORE_LIMIT: int = 10
     PAGE_LIMIT: int = 10
+    BATCH_SIZE: int = 1000
+    FETCH_COALESCE_WINDOW: float = 0.001
+    FETCH_COALESCE_LIMIT: int = 256
+    READ_CACHE_SIZE: int = 1024
+    READ_CACHE_TTL: float = 5.0
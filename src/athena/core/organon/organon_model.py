@@ -1,20 +1,284 @@
 import asyncio
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
-from neo4j import AsyncGraphDatabase
+from neo4j import (
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncResult,
+    AsyncSession,
+    RoutingControl,
+)
 
 from src.athena.core import logger
 from src.athena.core.ai_models import LLMBase
 
 from .operations.organon_init_op import (
     CLEAR_ORGANON_QUERIES,
-    DROP_CONSTRAINT_QUERY,
-    DROP_INDEX_QUERY,
     GET_CONSTRAINTS_QUERY,
     GET_INDEXES_QUERY,
     ORGANON_INIT_QUERIES,
+    drop_constraint_query,
+    drop_index_query,
+)
+from .operations.organon_node_op import get_fetch_nodes_query
+from .organon_config import (
+    OrganonConfig,
+    OrganonConnectionSettings,
+    get_connection_settings,
+)
+
+_WRITE_CLAUSE = re.compile(
+    r"\b(CREATE|MERGE|SET|DELETE|REMOVE|DROP|CALL|LOAD|FOREACH)\b", re.IGNORECASE
 )
-from .organon_config import OrganonConfig, OrganonConnectionSettings
+_SCHEMA_QUERY = re.compile(
+    r"\s*(CREATE|DROP)\s+(\w+\s+)?(CONSTRAINT|INDEX)\b", re.IGNORECASE
+)
+# Label chain of a node pattern, e.g. "(m:Message" or "(:User:Admin"; map
+# keys and relationship types are not preceded by a node's opening paren
+_NODE_LABELS = re.compile(r"\(\s*`?\w*`?\s*((?:[:&|]\s*!?`?\w+`?\s*)+)")
+
+
+@lru_cache(maxsize=256)
+def _classify_query(query: str) -> tuple[bool, frozenset[str]]:
+    """
+    Whether a query is a cacheable read, and the node labels it touches
+    """
+    labels = frozenset(
+        label
+        for chain in _NODE_LABELS.findall(query)
+        for label in re.findall(r"\w+", chain)
+    )
+    is_read = bool(re.match(r"\s*(MATCH|UNWIND)\b", query, re.IGNORECASE))
+    return is_read and not _WRITE_CLAUSE.search(query), labels
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _FrozenList(tuple):
+    """A list stored in the read cache, kept apart from the driver's tuples"""
+
+    __slots__ = ()
+
+
+def _read_only(value: Any) -> Any:
+    """Immutable copy of a query result, as stored in the read cache"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return _FrozenList(_read_only(item) for item in value)
+    if isinstance(value, tuple):
+        # data() renders relationships as (start, type, end) tuples
+        return tuple(_read_only(item) for item in value)
+    return value
+
+
+def _writable(value: Any) -> Any:
+    """Fresh dicts and lists rebuilt from a cached result"""
+    if isinstance(value, MappingProxyType):
+        return {key: _writable(item) for key, item in value.items()}
+    if isinstance(value, _FrozenList):
+        return [_writable(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_writable(item) for item in value)
+    return value
+
+
+async def _node_properties(result: AsyncResult) -> list[dict[str, Any]]:
+    # Skip data()'s recursive record-to-dict conversion
+    return [dict(node) for node in await result.value()]
+
+
+class _ReadCache:
+    """
+    LRU cache of read-only query results with a short time to live.
+
+    Every write bumps the epoch of the node labels it touches, which
+    invalidates cached reads over those labels; a write naming no label
+    clears the whole cache. Reads naming no label are never cached, since
+    no labeled write would invalidate them. Rows are stored as an immutable
+    copy, so nothing handed out to callers can change a cached entry.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[float, tuple[int, ...], tuple]] = (
+            OrderedDict()
+        )
+        self._epochs: dict[str, int] = {}
+
+    def _epoch_of(self, labels: frozenset[str]) -> tuple[int, ...]:
+        return tuple(self._epochs.get(label, 0) for label in sorted(labels))
+
+    def key(
+        self, query: str, params: dict[str, Any] | None, nodes: bool = False
+    ) -> tuple | None:
+        if self.maxsize <= 0:
+            return None
+        is_read, labels = _classify_query(query)
+        if not is_read or not labels:
+            return None
+        try:
+            frozen = _freeze(params or {})
+            hash(frozen)
+        except TypeError:
+            return None
+        return query, frozen, nodes
+
+    def get(self, key: tuple) -> tuple | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, epoch, rows = entry
+            labels = _classify_query(key[0])[1]
+            if expires_at > time.monotonic() and epoch == self._epoch_of(labels):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return rows
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple, rows: tuple, epoch: tuple[int, ...]):
+        # The epoch is snapshotted before the query ran, so a write landing
+        # mid-flight leaves the entry already stale
+        self._entries[key] = (time.monotonic() + self.ttl, epoch, rows)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def snapshot(self, key: tuple) -> tuple[int, ...]:
+        return self._epoch_of(_classify_query(key[0])[1])
+
+    def invalidate(self, query: str):
+        is_read, labels = _classify_query(query)
+        if is_read:
+            return
+        if not labels:
+            self._entries.clear()
+            return
+        for label in labels:
+            self._epochs[label] = self._epochs.get(label, 0) + 1
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class _SessionPool:
+    """
+    Pool of reusable driver sessions, and the bound on how many queries run
+    at once.
+
+    Every query holds one of `size` slots while it runs: the multi-query
+    paths through a pooled session, the single queries through `slot`.
+    Sessions returned after the pool is closed are closed instead of pooled.
+    """
+
+    def __init__(self, driver: AsyncDriver, size: int):
+        self.driver = driver
+        self.size = size
+        self.closed = False
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[AsyncSession] = []
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self._slots:
+            yield
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        async with self._slots:
+            session = self._idle.pop() if self._idle else self.driver.session()
+            try:
+                yield session
+            finally:
+                if self.closed:
+                    await session.close()
+                else:
+                    self._idle.append(session)
+
+    async def close(self):
+        self.closed = True
+        while self._idle:
+            await self._idle.pop().close()
+
+
+class _FetchCoalescer:
+    """
+    Groups concurrent single-node fetches of one label into one UNWIND query.
+
+    Fetches are collected for `window` seconds, or until `limit` distinct
+    uuids are pending, then resolved together from a single round-trip.
+    """
+
+    def __init__(self, model: "OrganonModel", node_type: str):
+        get_fetch_nodes_query(node_type)  # Reject unregistered node types early
+        self.model = model
+        self.node_type = node_type
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._timer: asyncio.Task | None = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def fetch(self, uuid: str) -> dict[str, Any] | None:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(uuid, []).append(future)
+        if len(self._pending) >= self.model.config.FETCH_COALESCE_LIMIT:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        return await future
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.model.config.FETCH_COALESCE_WINDOW)
+        self._timer = None
+        self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        task = asyncio.create_task(self._resolve(pending))
+        # Keep a reference so the batch isn't garbage collected mid-flight
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _resolve(self, pending: dict[str, list[asyncio.Future]]):
+        try:
+            found = await self.model.fetch_nodes(self.node_type, list(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        nodes = {node["uuid"]: node for node in found}
+        for uuid, futures in pending.items():
+            node = nodes.get(uuid)
+            for future in futures:
+                if not future.done():
+                    future.set_result(node)
 
 
 class OrganonModel:
@@ -30,15 +294,19 @@ class OrganonModel:
         Note: Direct instantiation does not perform asynchronous initialization.
         Use the `create` class method to ensure proper initialization.
         """
-        self.settings = settings if settings else OrganonConnectionSettings()
+        self.settings = settings if settings else get_connection_settings()
         self.config = config if config else OrganonConfig()
         self.model = model
-        self.semaphore = asyncio.Semaphore(self.config.SEMAPHORE_LIMIT)
+        self._fetch_coalescers: dict[str, _FetchCoalescer] = {}
+        self._read_cache = _ReadCache(
+            self.config.READ_CACHE_SIZE, self.config.READ_CACHE_TTL
+        )
         self.driver = AsyncGraphDatabase.driver(
             f"bolt://{self.settings.host}:{self.settings.port}",
             auth=(self.settings.user, self.settings.password),
             database=self.settings.database,
         )
+        self._sessions = _SessionPool(self.driver, self.config.SEMAPHORE_LIMIT)
 
     async def __ainit__(self):
         """Asynchronous initializer."""
@@ -57,17 +325,65 @@ class OrganonModel:
         return instance
 
     async def run_query(self, query: str, params: dict[str, Any] | None = None):
-        logger.debug(f"Executing query: {query} with params: {params}")
-        async with self.semaphore:
-            async with self.driver.session() as session:
-                try:
-                    result = await session.run(query, params)
-                    return await result.data()
-                except Exception as e:
-                    logger.error(
-                        f"Unexpected error running query '{query}' with params {params}: {e}"
-                    )
-                    raise e
+        return await self._execute(query, params)
+
+    async def _execute(
+        self, query: str, params: dict[str, Any] | None, nodes: bool = False
+    ) -> list:
+        """
+        Run a query through the read cache. With `nodes`, the query must return
+        a single node column and the rows are that node's properties.
+
+        Cache hits return fresh rows rebuilt from the cached copy, so callers
+        may mutate what they get back.
+        """
+        cache_key = self._read_cache.key(query, params, nodes)
+        if cache_key is not None:
+            cached = self._read_cache.get(cache_key)
+            if cached is not None:
+                return _writable(cached)
+            epoch = self._read_cache.snapshot(cache_key)
+        else:
+            self._read_cache.invalidate(query)
+
+        # Lazy formatting, and only the param names: values can be embeddings
+        logger.debug(
+            "Executing query: %s with params: %s", query, params and list(params)
+        )
+        # The driver's managed transaction handles the session and retries
+        # transient errors; reads can be routed to any cluster member. The
+        # pool slot keeps these within SEMAPHORE_LIMIT alongside the sessions
+        try:
+            async with self._sessions.slot():
+                rows = await self.driver.execute_query(
+                    query,
+                    params,
+                    routing_=(
+                        RoutingControl.READ
+                        if _classify_query(query)[0]
+                        else RoutingControl.WRITE
+                    ),
+                    database_=self.settings.database,
+                    result_transformer_=_node_properties if nodes else AsyncResult.data,
+                )
+        except Exception as e:
+            logger.error(
+                f"Unexpected error running query '{query}' "
+                f"with params {params and list(params)}: {e}"
+            )
+            raise e
+
+        if cache_key is not None:
+            self._read_cache.put(cache_key, _read_only(rows), epoch)
+        else:
+            # Reads that ran while the write was in flight may have cached
+            # the previous state
+            self._read_cache.invalidate(query)
+        return rows
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Hit/miss counters, size and hit rate of the read query cache"""
+        return self._read_cache.stats()
 
     async def run_queries(
         self,
@@ -80,21 +396,123 @@ class OrganonModel:
         elif len(params) != len(queries):
             raise ValueError("Number of parameter sets must match number of queries")
 
+        for query in queries:
+            self._read_cache.invalidate(query)
+
         if sequential:
-            results = []
-            async with self.semaphore:
-                async with self.driver.session() as session:
-                    for query, param in zip(queries, params, strict=True):
+            return await self._run_sequential(queries, params)
+        return await self._run_pipelined(queries, params)
+
+    async def _run_sequential(
+        self, queries: list[str], params: list[dict[str, Any] | None]
+    ) -> list:
+        """
+        Run queries in order, the writes in one transaction; schema queries
+        auto-commit on their own, after committing what came before them.
+        """
+        results = []
+        async with self._sessions.session() as session:
+            tx = None
+            try:
+                for query, param in zip(queries, params, strict=True):
+                    if _SCHEMA_QUERY.match(query):
+                        # Schema changes can't share a transaction with writes
+                        if tx is not None:
+                            await tx.commit()
+                            await tx.close()
+                            tx = None
                         result = await session.run(query, param)
-                        results.append(await result.data())
-            return results
-
-        results = await asyncio.gather(
-            *[
-                self.run_query(query, param)
-                for query, param in zip(queries, params, strict=True)
-            ]
-        )
+                    else:
+                        if tx is None:
+                            tx = await session.begin_transaction()
+                        result = await tx.run(query, param)
+                    results.append(await result.data())
+                if tx is not None:
+                    await tx.commit()
+            finally:
+                if tx is not None:
+                    await tx.close()
+        return results
+
+    async def _run_pipelined(
+        self, queries: list[str], params: list[dict[str, Any] | None]
+    ) -> list:
+        """
+        Pipeline every query through one transaction: the results are only
+        awaited once all queries are sent, and everything commits once.
+        """
+        async with self._sessions.session() as session:
+            tx = await session.begin_transaction()
+            try:
+                cursors = [
+                    await tx.run(query, param)
+                    for query, param in zip(queries, params, strict=True)
+                ]
+                results = [await cursor.data() for cursor in cursors]
+                await tx.commit()
+            except Exception as e:
+                logger.error(
+                    f"Unexpected error running {len(queries)} queries "
+                    f"in one transaction: {e}"
+                )
+                raise e
+            finally:
+                await tx.close()
+        return results
+
+    async def fetch_nodes(
+        self, node_type: str, uuids: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch the properties of every existing node of a type among `uuids`.
+
+        Raises:
+            ValueError: If the node type is not registered in NODE_DEFINITIONS
+        """
+        query = get_fetch_nodes_query(node_type)
+        return await self._execute(query, {"uuids": uuids}, nodes=True)
+
+    async def fetch_node(self, node_type: str, uuid: str) -> dict[str, Any] | None:
+        """
+        Fetch a node's properties by uuid, or None if it doesn't exist.
+
+        Concurrent fetches of the same node type are coalesced into a single
+        query.
+
+        Raises:
+            ValueError: If the node type is not registered in NODE_DEFINITIONS
+        """
+        coalescer = self._fetch_coalescers.get(node_type)
+        if coalescer is None:
+            coalescer = self._fetch_coalescers[node_type] = _FetchCoalescer(
+                self, node_type
+            )
+        return await coalescer.fetch(uuid)
+
+    async def run_batch(
+        self,
+        query: str,
+        rows: list[dict[str, Any]],
+        batch_size: int | None = None,
+    ):
+        """
+        Run an UNWIND query over `rows`, one round-trip per chunk of rows.
+        """
+        batch_size = batch_size or self.config.BATCH_SIZE
+        self._read_cache.invalidate(query)
+        results = []
+        async with self._sessions.session() as session:
+            for start in range(0, len(rows), batch_size):
+                chunk = rows[start : start + batch_size]
+                try:
+                    result = await session.run(query, {"rows": chunk})
+                    results.extend(await result.data())
+                except Exception as e:
+                    logger.error(
+                        f"Unexpected error running batch query '{query}' "
+                        f"on {len(chunk)} rows: {e}"
+                    )
+                    raise e
         return results
 
     async def update_settings(self, **kwargs):
@@ -105,20 +523,40 @@ class OrganonModel:
             or new_settings.user != self.settings.user
             or new_settings.password != self.settings.password
         ):
-            await self.driver.close()
+            old_driver, old_sessions = self.driver, self._sessions
             self.driver = AsyncGraphDatabase.driver(
                 f"bolt://{new_settings.host}:{new_settings.port}",
                 auth=(new_settings.user, new_settings.password),
                 database=new_settings.database,
             )
+            self._sessions = _SessionPool(self.driver, self.config.SEMAPHORE_LIMIT)
+            await old_sessions.close()
+            await old_driver.close()
+            self._read_cache = _ReadCache(
+                self.config.READ_CACHE_SIZE, self.config.READ_CACHE_TTL
+            )
         self.settings = new_settings
 
     async def update_config(self, **kwargs):
         new_config = self.config.model_copy(update=kwargs)
         if new_config.SEMAPHORE_LIMIT != self.config.SEMAPHORE_LIMIT:
-            self.semaphore = asyncio.Semaphore(new_config.SEMAPHORE_LIMIT)
+            old_sessions = self._sessions
+            self._sessions = _SessionPool(self.driver, new_config.SEMAPHORE_LIMIT)
+            await old_sessions.close()
+        if (
+            new_config.READ_CACHE_SIZE != self.config.READ_CACHE_SIZE
+            or new_config.READ_CACHE_TTL != self.config.READ_CACHE_TTL
+        ):
+            self._read_cache = _ReadCache(
+                new_config.READ_CACHE_SIZE, new_config.READ_CACHE_TTL
+            )
         self.config = new_config
 
+    async def close(self):
+        """Close the pooled sessions and the driver."""
+        await self._sessions.close()
+        await self.driver.close()
+
     async def initialize_organon(self):
         await self.run_queries(ORGANON_INIT_QUERIES, sequential=True)
         logger.info("Organon initialized: constraints and indexes created.")
@@ -130,19 +568,22 @@ class OrganonModel:
         logger.info("Dropping constraints...")
         fetched_constraints = await self.run_query(GET_CONSTRAINTS_QUERY)
         logger.info(f"Found {len(fetched_constraints)} constraints to drop.")
-        for row in fetched_constraints:
-            name = row["name"]
-            query = DROP_CONSTRAINT_QUERY.format(name=name)
-            await self.run_query(query)
+        # The drops are independent; each takes a session pool slot, so at most
+        # SEMAPHORE_LIMIT run at once
+        await asyncio.gather(
+            *(
+                self.run_query(drop_constraint_query(row["name"]))
+                for row in fetched_constraints
+            )
+        )
         logger.info("All constraints dropped.")
 
         logger.info("Dropping indexes...")
         fetched_indexes = await self.run_query(GET_INDEXES_QUERY)
         logger.info(f"Found {len(fetched_indexes)} indexes to drop.")
-        for row in fetched_indexes:
-            name = row["name"]
-            query = DROP_INDEX_QUERY.format(name=name)
-            await self.run_query(query)
+        await asyncio.gather(
+            *(self.run_query(drop_index_query(row["name"])) for row in fetched_indexes)
+        )
         logger.info("All constraints and indexes dropped.")
 
     async def clear_organon(self):
@@ -1,4 +1,50 @@
-from .organon_schemas import PlatformType
+import datetime
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from .schemas.organon_nodes import PlatformType
+
+
+class _CachedClock:
+    """
+    UTC clock that reads the system time at most once per millisecond.
+
+    Objects built in a tight loop share one timestamp instead of each paying
+    for a datetime.now call.
+    """
+
+    __slots__ = ("resolution_ns", "_cached", "_read_at", "_pinned")
+
+    def __init__(self, resolution_ns: int = 1_000_000):
+        self.resolution_ns = resolution_ns
+        self._cached: datetime.datetime | None = None
+        self._read_at = 0
+        self._pinned: datetime.datetime | None = None
+
+    def now_utc(self) -> datetime.datetime:
+        if self._pinned is not None:
+            return self._pinned
+        now_ns = time.monotonic_ns()
+        if self._cached is None or now_ns - self._read_at >= self.resolution_ns:
+            self._cached = datetime.datetime.now(datetime.timezone.utc)
+            self._read_at = now_ns
+        return self._cached
+
+
+_clock = _CachedClock()
+now_utc = _clock.now_utc
+
+
+@contextmanager
+def pin_now(moment: datetime.datetime | None = None) -> Iterator[datetime.datetime]:
+    """Freezes the cached clock at `moment` (default: now) within the block."""
+    previous = _clock._pinned
+    _clock._pinned = moment or datetime.datetime.now(datetime.timezone.utc)
+    try:
+        yield _clock._pinned
+    finally:
+        _clock._pinned = previous
 
 
 def generate_global_message_id(
@@ -14,8 +60,7 @@ def generate_global_message_id(
     Returns:
         A globally unique message ID.
     """
-    if not isinstance(platform, PlatformType):
-        raise ValueError("Platform must be a valid PlatformType")
+    assert isinstance(platform, PlatformType), "Platform must be a PlatformType"
 
     return f"{platform.value}_{chat_id}_{message_id}"
 
@@ -33,13 +78,12 @@ def generate_global_cluster_id(
     Returns:
         A globally unique cluster ID.
     """
-    if not isinstance(platform, PlatformType):
-        raise ValueError("Platform must be a valid PlatformType")
+    assert isinstance(platform, PlatformType), "Platform must be a PlatformType"
 
     return f"{platform.value}_{room_id}_{cluster_id}"
 
 
-def generate_global_user_id(platform: PlatformType, user_id: int) -> str:
+def generate_global_user_id(platform: PlatformType, user_id: int | str) -> str:
     """Generates a globally unique user ID.
 
     Args:
@@ -49,12 +93,6 @@ def generate_global_user_id(platform: PlatformType, user_id: int) -> str:
     Returns:
         A globally unique user ID.
     """
-    if not isinstance(platform, PlatformType):
-        raise ValueError("Platform must be a valid PlatformType")
-    if not isinstance(user_id, int):
-        try:
-            user_id = str(user_id)
-        except ValueError:
-            raise ValueError("User ID must be an integer or a string")
+    assert isinstance(platform, PlatformType), "Platform must be a PlatformType"
 
     return f"{platform.value}_{user_id}"
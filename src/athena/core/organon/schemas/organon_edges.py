@@ -15,22 +15,43 @@ the underlying Cypher query generation for edge operations.
 """
 
 import datetime
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import cache
 from typing import Any, ClassVar, TypeVar
 
-from pydantic import BaseModel, Field
-
 from ..operations.organon_edge_op import (
     EDGE_DEFINITIONS,
     EdgeType,
     get_edge_query,
+    get_edge_uuid_params,
 )
+from ..organon_utils import now_utc
 from .organon_nodes import OrganonNode
 
 # Type variable for self-referencing
 E = TypeVar("E", bound="OrganonEdge")
 
 
-class OrganonEdge(BaseModel):
+@cache
+def _resolve_edge(
+    source_cls: type[OrganonNode], target_cls: type[OrganonNode], relationship_type: str
+) -> tuple[str, str, str]:
+    """
+    Validate a node class pair for a relationship type once, and return its
+    query along with the source and target uuid parameter names
+    """
+    key = (source_cls.__name__, target_cls.__name__, relationship_type)
+    if key not in EDGE_DEFINITIONS:
+        raise ValueError(
+            f"Invalid nodes for edge: {key[0]} -> {relationship_type} -> {key[1]}"
+        )
+    return (get_edge_query(*key), *get_edge_uuid_params(*key))
+
+
+@dataclass(slots=True, frozen=True)
+class OrganonEdge:
     """
     Base class for all edge (relationship) types in the Organon graph database.
 
@@ -56,20 +77,28 @@ class OrganonEdge(BaseModel):
     FROM_NODE_CLASS: ClassVar[type[OrganonNode]]
     TO_NODE_CLASS: ClassVar[type[OrganonNode]]
 
-    created_at: datetime.datetime = Field(
-        default_factory=lambda: datetime.datetime.now(datetime.timezone.utc),
-        description="Timestamp when the relationship was created.",
-    )
-    updated_at: datetime.datetime = Field(
-        default_factory=lambda: datetime.datetime.now(datetime.timezone.utc),
-        description="Timestamp when the relationship was last updated.",
-    )
-    valid_from: datetime.datetime | None = Field(
-        None, description="Start of relationship validity."
-    )
-    valid_to: datetime.datetime | None = Field(
-        None, description="End of relationship validity."
-    )
+    created_at: datetime.datetime = field(default_factory=now_utc)
+    # Defaults to created_at, so a fresh edge reads the clock once
+    updated_at: datetime.datetime | None = None
+    valid_from: datetime.datetime | None = None
+    valid_to: datetime.datetime | None = None
+
+    # Timestamp parameters, serialized once when the edge is built
+    _timestamp_params: dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        created_at = self.created_at.isoformat()
+        if self.updated_at is None:
+            object.__setattr__(self, "updated_at", self.created_at)
+            updated_at = created_at
+        else:
+            updated_at = self.updated_at.isoformat()
+        params = {"created_at": created_at, "updated_at": updated_at}
+        if self.valid_from:
+            params["valid_from"] = self.valid_from.isoformat()
+        if self.valid_to:
+            params["valid_to"] = self.valid_to.isoformat()
+        object.__setattr__(self, "_timestamp_params", params)
 
     def connect(
         self, source_node: OrganonNode, target_node: OrganonNode
@@ -104,38 +133,65 @@ class OrganonEdge(BaseModel):
             await session.run(query, params)
             ```
         """
-        # Get the node type names
-        source_type = source_node.__class__.__name__
-        target_type = target_node.__class__.__name__
-
-        # Check if this edge type supports this node pair
-        key = (source_type, target_type, self.__class__.RELATIONSHIP_TYPE)
-        if key not in EDGE_DEFINITIONS:
-            raise ValueError(
-                f"Invalid nodes for edge: {source_type} -> {self.__class__.RELATIONSHIP_TYPE} -> {target_type}"
-            )
-
-        # Get the query
-        query = get_edge_query(
-            source_type, target_type, self.__class__.RELATIONSHIP_TYPE
+        query, source_param, target_param = _resolve_edge(
+            type(source_node), type(target_node), self.RELATIONSHIP_TYPE
         )
 
         # Prepare parameters
         params = {
-            f"{source_type[0].lower()}_uuid": source_node.uuid,
-            f"{target_type[0].lower()}_uuid": target_node.uuid,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            source_param: source_node.uuid,
+            target_param: target_node.uuid,
+            **self._timestamp_params,
         }
 
-        # Add optional validity parameters if present
-        if self.valid_from:
-            params["valid_from"] = self.valid_from.isoformat()
-        if self.valid_to:
-            params["valid_to"] = self.valid_to.isoformat()
-
         return query, params
 
+    def connect_many(
+        self, pairs: Iterable[tuple[OrganonNode, OrganonNode]]
+    ) -> list[tuple[str, list[dict[str, Any]]]]:
+        """
+        Connect many node pairs with this edge type in as few queries as possible.
+
+        Pairs are grouped by their node classes, and each group becomes one
+        UNWIND query whose rows carry the same values `connect` would pass as
+        parameters. The rows are meant for `OrganonModel.run_batch`.
+
+        Args:
+            pairs: (source_node, target_node) pairs to connect
+
+        Returns:
+            A list of (query_string, rows) tuples, one per node class pair
+
+        Raises:
+            ValueError: If any pair is not registered in EDGE_DEFINITIONS
+        """
+        buckets: dict[tuple[type, type], list[dict[str, Any]]] = defaultdict(list)
+        for source_node, target_node in pairs:
+            source_cls, target_cls = type(source_node), type(target_node)
+            _, source_param, target_param = _resolve_edge(
+                source_cls, target_cls, self.RELATIONSHIP_TYPE
+            )
+            buckets[source_cls, target_cls].append(
+                {
+                    source_param: source_node.uuid,
+                    target_param: target_node.uuid,
+                    **self._timestamp_params,
+                }
+            )
+
+        return [
+            (
+                get_edge_query(
+                    source_cls.__name__,
+                    target_cls.__name__,
+                    self.RELATIONSHIP_TYPE,
+                    batch=True,
+                ),
+                rows,
+            )
+            for (source_cls, target_cls), rows in buckets.items()
+        ]
+
 
 # --- Concrete Edge Classes ---
 class PostedIn(OrganonEdge):
@@ -164,7 +220,9 @@ class PostedIn(OrganonEdge):
         ```
     """
 
-    RELATIONSHIP_TYPE: ClassVar[EdgeType] = "POSTED_IN"
+    __slots__ = ()
+
+    RELATIONSHIP_TYPE: ClassVar[EdgeType] = EdgeType.POSTED_IN
     FROM_NODE_CLASS: ClassVar[type[OrganonNode]] = None
     TO_NODE_CLASS: ClassVar[type[OrganonNode]] = None
 
@@ -193,7 +251,9 @@ class BelongsTo(OrganonEdge):
         ```
     """
 
-    RELATIONSHIP_TYPE: ClassVar[EdgeType] = "BELONGS_TO"
+    __slots__ = ()
+
+    RELATIONSHIP_TYPE: ClassVar[EdgeType] = EdgeType.BELONGS_TO
     FROM_NODE_CLASS: ClassVar[type[OrganonNode]] = None
     TO_NODE_CLASS: ClassVar[type[OrganonNode]] = None
 
@@ -224,7 +284,9 @@ class RelatedTo(OrganonEdge):
         ```
     """
 
-    RELATIONSHIP_TYPE: ClassVar[EdgeType] = "RELATED_TO"
+    __slots__ = ()
+
+    RELATIONSHIP_TYPE: ClassVar[EdgeType] = EdgeType.RELATED_TO
     FROM_NODE_CLASS: ClassVar[type[OrganonNode]] = None
     TO_NODE_CLASS: ClassVar[type[OrganonNode]] = None
 
@@ -254,7 +316,9 @@ class Mentions(OrganonEdge):
         ```
     """
 
-    RELATIONSHIP_TYPE: ClassVar[EdgeType] = "MENTIONS"
+    __slots__ = ()
+
+    RELATIONSHIP_TYPE: ClassVar[EdgeType] = EdgeType.MENTIONS
     FROM_NODE_CLASS: ClassVar[type[OrganonNode]] = None
     TO_NODE_CLASS: ClassVar[type[OrganonNode]] = None
 
@@ -284,7 +348,9 @@ class Includes(OrganonEdge):
         ```
     """
 
-    RELATIONSHIP_TYPE: ClassVar[EdgeType] = "INCLUDES"
+    __slots__ = ()
+
+    RELATIONSHIP_TYPE: ClassVar[EdgeType] = EdgeType.INCLUDES
     FROM_NODE_CLASS: ClassVar[type[OrganonNode]] = None
     TO_NODE_CLASS: ClassVar[type[OrganonNode]] = None
 
@@ -314,7 +380,9 @@ class ParticipatesIn(OrganonEdge):
         ```
     """
 
-    RELATIONSHIP_TYPE: ClassVar[EdgeType] = "PARTICIPATES_IN"
+    __slots__ = ()
+
+    RELATIONSHIP_TYPE: ClassVar[EdgeType] = EdgeType.PARTICIPATES_IN
     FROM_NODE_CLASS: ClassVar[type[OrganonNode]] = None
     TO_NODE_CLASS: ClassVar[type[OrganonNode]] = None
 
@@ -345,7 +413,9 @@ class HasPreference(OrganonEdge):
         ```
     """
 
-    RELATIONSHIP_TYPE: ClassVar[EdgeType] = "HAS_PREFERENCE"
+    __slots__ = ()
+
+    RELATIONSHIP_TYPE: ClassVar[EdgeType] = EdgeType.HAS_PREFERENCE
     FROM_NODE_CLASS: ClassVar[type[OrganonNode]] = None
     TO_NODE_CLASS: ClassVar[type[OrganonNode]] = None
 
@@ -375,7 +445,9 @@ class For(OrganonEdge):
         ```
     """
 
-    RELATIONSHIP_TYPE: ClassVar[EdgeType] = "FOR"
+    __slots__ = ()
+
+    RELATIONSHIP_TYPE: ClassVar[EdgeType] = EdgeType.FOR
     FROM_NODE_CLASS: ClassVar[type[OrganonNode]] = None
     TO_NODE_CLASS: ClassVar[type[OrganonNode]] = None
 
@@ -406,6 +478,32 @@ class Expresses(OrganonEdge):
         ```
     """
 
-    RELATIONSHIP_TYPE: ClassVar[EdgeType] = "EXPRESSES"
+    __slots__ = ()
+
+    RELATIONSHIP_TYPE: ClassVar[EdgeType] = EdgeType.EXPRESSES
     FROM_NODE_CLASS: ClassVar[type[OrganonNode]] = None
     TO_NODE_CLASS: ClassVar[type[OrganonNode]] = None
+
+
+def build_connect_query(
+    edge_cls: type[OrganonEdge], source_node: OrganonNode, target_node: OrganonNode
+) -> tuple[str, dict[str, Any]]:
+    """
+    Get the query and parameters connecting two nodes, without building an edge.
+
+    Equivalent to `edge_cls().connect(source_node, target_node)` for an edge
+    with default timestamps and no validity period.
+
+    Raises:
+        ValueError: If the node pair is not registered for the edge type
+    """
+    query, source_param, target_param = _resolve_edge(
+        type(source_node), type(target_node), edge_cls.RELATIONSHIP_TYPE
+    )
+    timestamp = now_utc().isoformat()
+    return query, {
+        source_param: source_node.uuid,
+        target_param: target_node.uuid,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+    }
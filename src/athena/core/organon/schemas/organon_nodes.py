@@ -17,22 +17,15 @@ from ..operations.organon_node_op import (
     CREATE_ROOM_NODE_QUERY,
     CREATE_TOPIC_NODE_QUERY,
     CREATE_USER_NODE_QUERY,
-    FETCH_CLUSTER_NODE_QUERY,
     FETCH_CLUSTERS_NODE_QUERY,
     FETCH_COMMUNITIES_NODE_QUERY,
-    FETCH_COMMUNITY_NODE_QUERY,
     FETCH_ENTITIES_NODE_QUERY,
-    FETCH_ENTITY_NODE_QUERY,
-    FETCH_MESSAGE_NODE_QUERY,
     FETCH_MESSAGES_NODE_QUERY,
-    FETCH_PREFERENCE_NODE_QUERY,
     FETCH_PREFERENCES_NODE_QUERY,
-    FETCH_ROOM_NODE_QUERY,
     FETCH_ROOMS_NODE_QUERY,
-    FETCH_TOPIC_NODE_QUERY,
     FETCH_TOPICS_NODE_QUERY,
-    FETCH_USER_NODE_QUERY,
     FETCH_USERS_NODE_QUERY,
+    get_batch_create_node_query,
 )
 
 
@@ -119,7 +112,6 @@ class OrganonNode(BaseModel, ABC):
 
     Class Variables:
         NODE_LABEL: The Neo4j node label used in Cypher queries
-        FETCH_QUERY: Query template for fetching a single node by UUID
         FETCH_MULTI_QUERY: Query template for fetching multiple nodes by UUIDs
         CREATE_QUERY: Query template for creating or updating a node
         HAS_EMBEDDING: Whether this node type supports vector embeddings
@@ -135,7 +127,6 @@ class OrganonNode(BaseModel, ABC):
 
     # Class variables for node metadata
     NODE_LABEL: ClassVar[str] = ""  # Override in subclasses
-    FETCH_QUERY: ClassVar[str] = ""  # Single-node fetch query
     FETCH_MULTI_QUERY: ClassVar[str] = ""  # Multi-node fetch query
     CREATE_QUERY: ClassVar[str] = ""  # Node creation/update query
     HAS_EMBEDDING: ClassVar[bool] = False  # Whether the node has an embedding property
@@ -201,6 +192,9 @@ class OrganonNode(BaseModel, ABC):
         """
         Get the query and parameters to fetch a node by its UUID.
 
+        Single fetches go through the multi-node query with a one-item list,
+        so they can be coalesced with concurrent fetches of the same label.
+
         Args:
             uuid: The UUID of the node to fetch
 
@@ -208,13 +202,9 @@ class OrganonNode(BaseModel, ABC):
             A tuple of (query_string, parameters_dict) to execute against the database
 
         Raises:
-            NotImplementedError: If the subclass doesn't define FETCH_QUERY
+            NotImplementedError: If the subclass doesn't define FETCH_MULTI_QUERY
         """
-        if not self.__class__.FETCH_QUERY:
-            raise NotImplementedError(
-                f"FETCH_QUERY not defined for {self.__class__.__name__}"
-            )
-        return self.__class__.FETCH_QUERY, {"uuid": uuid}
+        return await self.get_by_uuids([uuid])
 
     async def get_by_uuids(self, uuids: list[str]) -> tuple[str, dict[str, Any]]:
         """
@@ -345,6 +335,30 @@ class OrganonNode(BaseModel, ABC):
 
         return query, params
 
+    @classmethod
+    def save_many(cls, nodes: "list[OrganonNode]") -> tuple[str, list[dict[str, Any]]]:
+        """
+        Get the batch query and rows to save many nodes of this type at once.
+
+        The rows are meant for `OrganonModel.run_batch`, which MERGEs every
+        node of a chunk in a single round-trip. Like `save`, embeddings are
+        written with `db.create.setNodeVectorProperty`, and rows without one
+        leave the stored embedding untouched.
+
+        Args:
+            nodes: Nodes of this type to save
+
+        Returns:
+            A tuple of (query_string, rows) to execute against the database
+
+        Raises:
+            NotImplementedError: If the subclass doesn't define NODE_LABEL
+        """
+        if not cls.NODE_LABEL:
+            raise NotImplementedError(f"NODE_LABEL not defined for {cls.__name__}")
+        rows = [node.get_save_params() for node in nodes]
+        return get_batch_create_node_query(cls.NODE_LABEL), rows
+
 
 # --- Message Node Models ---
 class User(OrganonNode):
@@ -364,7 +378,6 @@ class User(OrganonNode):
 
     Class Variables:
         NODE_LABEL: "User" - The Neo4j label for this node type
-        FETCH_QUERY: Query to fetch a single user by UUID
         FETCH_MULTI_QUERY: Query to fetch multiple users by UUIDs
         CREATE_QUERY: Query to create or update a user
         HAS_EMBEDDING: True - Users support vector embeddings for similarity search
@@ -395,7 +408,6 @@ class User(OrganonNode):
     """
 
     NODE_LABEL: ClassVar[str] = "User"
-    FETCH_QUERY: ClassVar[str] = FETCH_USER_NODE_QUERY
     FETCH_MULTI_QUERY: ClassVar[str] = FETCH_USERS_NODE_QUERY
     CREATE_QUERY: ClassVar[str] = CREATE_USER_NODE_QUERY
     HAS_EMBEDDING: ClassVar[bool] = True
@@ -439,7 +451,6 @@ class Room(OrganonNode):
 
     Class Variables:
         NODE_LABEL: "Room" - The Neo4j label for this node type
-        FETCH_QUERY: Query to fetch a single room by UUID
         FETCH_MULTI_QUERY: Query to fetch multiple rooms by UUIDs
         CREATE_QUERY: Query to create or update a room
         HAS_EMBEDDING: True - Rooms support vector embeddings for similarity search
@@ -472,7 +483,6 @@ class Room(OrganonNode):
     """
 
     NODE_LABEL: ClassVar[str] = "Room"
-    FETCH_QUERY: ClassVar[str] = FETCH_ROOM_NODE_QUERY
     FETCH_MULTI_QUERY: ClassVar[str] = FETCH_ROOMS_NODE_QUERY
     CREATE_QUERY: ClassVar[str] = CREATE_ROOM_NODE_QUERY
     HAS_EMBEDDING: ClassVar[bool] = True
@@ -519,7 +529,6 @@ class Message(OrganonNode):
 
     Class Variables:
         NODE_LABEL: "Message" - The Neo4j label for this node type
-        FETCH_QUERY: Query to fetch a single message by UUID
         FETCH_MULTI_QUERY: Query to fetch multiple messages by UUIDs
         CREATE_QUERY: Query to create or update a message
         HAS_EMBEDDING: True - Messages support vector embeddings for similarity search
@@ -555,7 +564,6 @@ class Message(OrganonNode):
     """
 
     NODE_LABEL: ClassVar[str] = "Message"
-    FETCH_QUERY: ClassVar[str] = FETCH_MESSAGE_NODE_QUERY
     FETCH_MULTI_QUERY: ClassVar[str] = FETCH_MESSAGES_NODE_QUERY
     CREATE_QUERY: ClassVar[str] = CREATE_MESSAGE_NODE_QUERY
     HAS_EMBEDDING: ClassVar[bool] = True
@@ -600,7 +608,6 @@ class Cluster(OrganonNode):
 
     Class Variables:
         NODE_LABEL: "Cluster" - The Neo4j label for this node type
-        FETCH_QUERY: Query to fetch a single cluster by UUID
         FETCH_MULTI_QUERY: Query to fetch multiple clusters by UUIDs
         CREATE_QUERY: Query to create or update a cluster
         HAS_EMBEDDING: True - Clusters support vector embeddings (typically centroids)
@@ -635,7 +642,6 @@ class Cluster(OrganonNode):
     """
 
     NODE_LABEL: ClassVar[str] = "Cluster"
-    FETCH_QUERY: ClassVar[str] = FETCH_CLUSTER_NODE_QUERY
     FETCH_MULTI_QUERY: ClassVar[str] = FETCH_CLUSTERS_NODE_QUERY
     CREATE_QUERY: ClassVar[str] = CREATE_CLUSTER_NODE_QUERY
     HAS_EMBEDDING: ClassVar[bool] = True
@@ -678,7 +684,6 @@ class Community(OrganonNode):
 
     Class Variables:
         NODE_LABEL: "Community" - The Neo4j label for this node type
-        FETCH_QUERY: Query to fetch a single community by UUID
         FETCH_MULTI_QUERY: Query to fetch multiple communities by UUIDs
         CREATE_QUERY: Query to create or update a community
         HAS_EMBEDDING: False - Communities typically don't have embeddings
@@ -710,7 +715,6 @@ class Community(OrganonNode):
     """
 
     NODE_LABEL: ClassVar[str] = "Community"
-    FETCH_QUERY: ClassVar[str] = FETCH_COMMUNITY_NODE_QUERY
     FETCH_MULTI_QUERY: ClassVar[str] = FETCH_COMMUNITIES_NODE_QUERY
     CREATE_QUERY: ClassVar[str] = CREATE_COMMUNITY_NODE_QUERY
     HAS_EMBEDDING: ClassVar[bool] = False
@@ -751,7 +755,6 @@ class Entity(OrganonNode):
 
     Class Variables:
         NODE_LABEL: "Entity" - The Neo4j label for this node type
-        FETCH_QUERY: Query to fetch a single entity by UUID
         FETCH_MULTI_QUERY: Query to fetch multiple entities by UUIDs
         CREATE_QUERY: Query to create or update an entity
         HAS_EMBEDDING: True - Entities support vector embeddings for similarity search
@@ -787,7 +790,6 @@ class Entity(OrganonNode):
     """
 
     NODE_LABEL: ClassVar[str] = "Entity"
-    FETCH_QUERY: ClassVar[str] = FETCH_ENTITY_NODE_QUERY
     FETCH_MULTI_QUERY: ClassVar[str] = FETCH_ENTITIES_NODE_QUERY
     CREATE_QUERY: ClassVar[str] = CREATE_ENTITY_NODE_QUERY
     HAS_EMBEDDING: ClassVar[bool] = True
@@ -834,7 +836,6 @@ class Topic(OrganonNode):
 
     Class Variables:
         NODE_LABEL: "Topic" - The Neo4j label for this node type
-        FETCH_QUERY: Query to fetch a single topic by UUID
         FETCH_MULTI_QUERY: Query to fetch multiple topics by UUIDs
         CREATE_QUERY: Query to create or update a topic
         HAS_EMBEDDING: True - Topics support vector embeddings for similarity search
@@ -868,7 +869,6 @@ class Topic(OrganonNode):
     """
 
     NODE_LABEL: ClassVar[str] = "Topic"
-    FETCH_QUERY: ClassVar[str] = FETCH_TOPIC_NODE_QUERY
     FETCH_MULTI_QUERY: ClassVar[str] = FETCH_TOPICS_NODE_QUERY
     CREATE_QUERY: ClassVar[str] = CREATE_TOPIC_NODE_QUERY
     HAS_EMBEDDING: ClassVar[bool] = True
@@ -910,7 +910,6 @@ class Preference(OrganonNode):
 
     Class Variables:
         NODE_LABEL: "Preference" - The Neo4j label for this node type
-        FETCH_QUERY: Query to fetch a single preference by UUID
         FETCH_MULTI_QUERY: Query to fetch multiple preferences by UUIDs
         CREATE_QUERY: Query to create or update a preference
         HAS_EMBEDDING: False - Preferences typically don't have embeddings
@@ -942,7 +941,6 @@ class Preference(OrganonNode):
     """
 
     NODE_LABEL: ClassVar[str] = "Preference"
-    FETCH_QUERY: ClassVar[str] = FETCH_PREFERENCE_NODE_QUERY
     FETCH_MULTI_QUERY: ClassVar[str] = FETCH_PREFERENCES_NODE_QUERY
     CREATE_QUERY: ClassVar[str] = CREATE_PREFERENCE_NODE_QUERY
     HAS_EMBEDDING: ClassVar[bool] = False
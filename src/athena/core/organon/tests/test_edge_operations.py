@@ -6,11 +6,15 @@ import pytest
 from src.athena.core.organon.operations.organon_edge_op import (
     EDGE_DEFINITIONS,
     generate_edge_query,
+    get_edge_query,
+    get_edge_uuid_params,
 )
+from src.athena.core.organon.organon_utils import pin_now
 from src.athena.core.organon.schemas.organon_edges import (
     BelongsTo,
     PostedIn,
     RelatedTo,
+    build_connect_query,
 )
 from src.athena.core.organon.schemas.organon_nodes import (
     Cluster,
@@ -116,6 +120,51 @@ def test_query_generation():
         generate_edge_query("Invalid", "Room", "POSTED_IN")
 
 
+def test_query_generation_extra_props():
+    """Test that extra properties are set when creating and matching an edge."""
+    query = generate_edge_query("User", "Room", "POSTED_IN")
+
+    assert (
+        "ON CREATE SET p.created_at = $created_at, p.updated_at = $updated_at, "
+        "p.count = coalesce(p.count, 0) + 1" in query
+    )
+    assert (
+        "ON MATCH SET p.updated_at = $updated_at, p.count = coalesce(p.count, 0) + 1"
+        in query
+    )
+
+
+def test_query_generation_identifier_collision():
+    """Test that the relationship identifier never shadows a node identifier."""
+    query = generate_edge_query("Cluster", "Room", "RELATED_TO")
+
+    assert "MERGE (c)-[rel:RELATED_TO]->(r)" in query
+    assert "RETURN c, rel, r" in query
+    assert get_edge_uuid_params("Cluster", "Room", "RELATED_TO") == (
+        "c_uuid",
+        "r_uuid",
+    )
+
+
+def test_cached_edge_query():
+    """Test that cached edge queries match freshly generated ones."""
+    for key in EDGE_DEFINITIONS:
+        assert get_edge_query(*key) == generate_edge_query(*key)
+
+    with pytest.raises(ValueError):
+        get_edge_query("Invalid", "Room", "POSTED_IN")
+
+
+def test_batch_edge_query():
+    """Test that batch edge queries read the single-edge params from rows."""
+    query = get_edge_query("User", "Room", "POSTED_IN", batch=True)
+
+    assert query.lstrip().startswith("UNWIND $rows AS row")
+    assert "MATCH (u:User {uuid: row.u_uuid}), (r:Room {uuid: row.r_uuid})" in query
+    assert "ON MATCH SET p.updated_at = row.updated_at, p.count" in query
+    assert "$created_at" not in query
+
+
 def test_connect_posted_in(message, room, user):
     """Test connecting nodes with a POSTED_IN edge."""
     edge = PostedIn()
@@ -138,6 +187,15 @@ def test_connect_posted_in(message, room, user):
         edge.connect(user, message)  # Invalid combination
 
 
+def test_build_connect_query():
+    """Test that build_connect_query matches connect on a default edge."""
+    message = Message.model_construct(uuid=str(uuid4()))
+    room = Room.model_construct(uuid=str(uuid4()))
+    with pin_now():
+        expected = PostedIn().connect(message, room)
+        assert build_connect_query(PostedIn, message, room) == expected
+
+
 def test_connect_belongs_to(message, cluster):
     """Test connecting nodes with a BELONGS_TO edge."""
     edge = BelongsTo()
@@ -4,6 +4,13 @@ from unittest.mock import patch
 
 import pytest
 
+from src.athena.core.organon.operations.organon_node_op import (
+    BATCH_CREATE_NODE_QUERIES,
+    CREATE_NODE_QUERIES,
+    NODE_DEFINITIONS,
+    generate_batch_create_node_query,
+    generate_create_node_query,
+)
 from src.athena.core.organon.schemas.organon_nodes import (
     Cluster,
     Community,
@@ -210,12 +217,38 @@ def test_node_labels(node_class, expected_label):
 def test_required_metadata(node_class):
     """Test that all node classes have required metadata."""
     assert hasattr(node_class, "NODE_LABEL")
-    assert hasattr(node_class, "FETCH_QUERY")
     assert hasattr(node_class, "FETCH_MULTI_QUERY")
     assert hasattr(node_class, "CREATE_QUERY")
     assert hasattr(node_class, "HAS_EMBEDDING")
 
 
+@pytest.mark.parametrize(
+    "node_class",
+    [User, Room, Message, Cluster, Community, Entity, Topic, Preference],
+)
+def test_save_many(node_class):
+    """Test that batch saves unwind rows into a MERGE on the node's label."""
+    query, rows = node_class.save_many([])
+    assert rows == []
+    assert query.lstrip().startswith("UNWIND $rows AS row")
+    assert f":{node_class.NODE_LABEL} {{uuid: row.uuid}}" in query
+
+
+@pytest.mark.parametrize("node_type", list(NODE_DEFINITIONS))
+def test_generated_create_queries(node_type):
+    """Test that the import-time create queries keep created_at on updates."""
+    query = CREATE_NODE_QUERIES[node_type]
+    assert query == generate_create_node_query(node_type)
+    assert BATCH_CREATE_NODE_QUERIES[node_type] == generate_batch_create_node_query(
+        node_type
+    )
+
+    on_create, on_match = query.split("ON MATCH SET")
+    assert "created_at: $created_at" in on_create
+    assert "created_at" not in on_match
+    assert "updated_at: $updated_at" in on_match
+
+
 @pytest.mark.parametrize(
     "node_class,has_embedding",
     [
@@ -361,8 +394,8 @@ async def test_fetch_operations(user):
     """Test fetch operations for nodes."""
     # Test get_by_uuid
     query, params = await user.get_by_uuid("test-uuid")
-    assert query == User.FETCH_QUERY
-    assert params["uuid"] == "test-uuid"
+    assert query == User.FETCH_MULTI_QUERY
+    assert params["uuids"] == ["test-uuid"]
 
     # Test get_by_uuids
     query, params = await user.get_by_uuids(["uuid1", "uuid2"])
@@ -2,6 +2,12 @@ class SystemConfig:
     CACHE_TTL = 60 * 5
     FAILURE_THRESHOLD = 5
     RECOVERY_TIMEOUT = 30
+    RETRY_BASE_DELAY = 0.2
+    RETRY_MAX_DELAY = 5.0
+    RETRY_WINDOW = 10
+    RETRY_REJECTION_THRESHOLD = 0.5
+    RETRY_COOLDOWN = 30
+    RETRY_MIN_SAMPLES = 10
 
 
 system_config = SystemConfig()
@@ -46,12 +46,19 @@ class ApolloSummarizeAgent:
         self._inject_system_prompt(SUMMARIZE_AGENT_SYSTEM_PROMPT)
 
     def _inject_system_prompt(self, system_prompt: str):
+        # Every Deus selecting the same model shares its Agent, and the
+        # persona comes in through deps, so one registration serves them all
+        if getattr(self.agent, "_summary_prompt_registered", False):
+            return
+
         @self.agent.system_prompt
         async def message_summary_context(ctx: RunContext[SummaryDependency]) -> str:
             agent_persona = ctx.deps.persona
             bio_prompt = agent_persona.use_persona(system_prompt)
             return bio_prompt
 
+        self.agent._summary_prompt_registered = True
+
     async def _transform_messages_into_clusters(
         self, messages: list[ChatMessage]
     ) -> list[ChatMessage]:
@@ -84,7 +91,7 @@ class ApolloSummarizeAgent:
     ) -> Any:
         """Centralized method for executing agent queries and handling responses."""
         try:
-            response = await self.agent.run(
+            response = await self.model.run(
                 query,
                 deps=deps,
                 result_type=result_type,